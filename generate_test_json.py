@@ -3,159 +3,474 @@
 Script to generate test JSON files of various sizes for testing the JSON editor.
 """
 
-import json
+import mmap
+import os
 import random
 import string
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+import orjson
 
-def random_string(length=10):
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is an optional accelerator for bulk random generation;
+    # everything falls back to the stdlib random module without it.
+    np = None
+
+# Optional binary output formats for --format msgpack / --format cbor
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+_np_rng = np.random.default_rng() if np is not None else None
+
+# Character pool for random strings, built once instead of concatenated
+# on every call
+_ALPHABET = string.ascii_letters + string.digits
+_ALPHABET_POOL = np.frombuffer(_ALPHABET.encode('ascii'), dtype=np.uint8) if np is not None else None
+
+# Zero-padded number strings, precomputed so date/timestamp assembly is
+# plain concatenation instead of f-string format machinery per field
+_PAD2 = [f"{n:02d}" for n in range(60)]
+
+# Pre-bound PRNG methods: skips the module-attribute lookup on every call
+_choices = random.choices
+
+
+def random_string(length: int = 10) -> str:
     """Generate a random string."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(_choices(_ALPHABET, k=length))
+
 
+def random_strings_batch(count: int, length: int) -> list:
+    """Generate `count` random strings of `length` chars in a single draw."""
+    if np is not None:
+        idx = _np_rng.integers(0, len(_ALPHABET_POOL), size=count * length)
+        buf = _ALPHABET_POOL[idx].tobytes().decode('ascii')
+    else:
+        buf = ''.join(_choices(_ALPHABET, k=count * length))
+    return [buf[i * length:(i + 1) * length] for i in range(count)]
 
-def generate_nested_object(depth=0, max_depth=5, items_per_level=10):
+
+def generate_nested_object(depth: int = 0, max_depth: int = 5, items_per_level: int = 10):
     """Generate a nested JSON object."""
-    if depth >= max_depth:
-        # Return leaf values
-        return random.choice([
-            random_string(20),
-            random.randint(0, 1000000),
-            random.random() * 1000,
-            True,
-            False,
-            None
-        ])
-
-    obj = {}
-    for i in range(items_per_level):
-        key = f"key_{depth}_{i}_{random_string(5)}"
-
-        # Randomly choose structure
-        choice = random.choice(['nested', 'array', 'value'])
-
-        if choice == 'nested':
-            obj[key] = generate_nested_object(depth + 1, max_depth, items_per_level)
-        elif choice == 'array':
-            array_size = random.randint(5, 20)
-            obj[key] = [
-                generate_nested_object(depth + 1, max_depth, max(2, items_per_level // 2))
-                for _ in range(array_size)
-            ]
+    def make_leaf():
+        # Pick the leaf kind first, then generate only the chosen value;
+        # building a list of all six candidates per call wasted a fresh
+        # 20-char string and a random float on every leaf
+        c = random.randrange(6)
+        if c == 0:
+            return random_string(20)
+        elif c == 1:
+            return random.randint(0, 1000000)
+        elif c == 2:
+            return random.random() * 1000
+        elif c == 3:
+            return True
+        elif c == 4:
+            return False
         else:
-            obj[key] = generate_nested_object(max_depth, max_depth, items_per_level)
+            return None
 
-    return obj
+    if depth >= max_depth:
+        return make_leaf()
+
+    # Explicit worklist instead of recursion: each entry is an empty dict
+    # to fill plus the depth and items_per_level it was created with. This
+    # avoids Python frame setup per node and any RecursionError risk.
+    # Bind the hot callables to locals so the worklist loop runs on
+    # LOAD_FAST instead of repeated global/attribute lookups
+    _randrange = random.randrange
+    _randint = random.randint
+    _random_string = random_string
+    _make_leaf = make_leaf
+
+    root = {}
+    stack = [(root, depth, items_per_level)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        obj, d, ipl = pop()
+        child_depth = d + 1
+        for i in range(ipl):
+            key = f"key_{d}_{i}_{_random_string(5)}"
+
+            # Randomly choose structure (0=nested, 1=array, 2=value)
+            choice = _randrange(3)
+
+            if choice == 0:
+                if child_depth >= max_depth:
+                    obj[key] = _make_leaf()
+                else:
+                    child = {}
+                    obj[key] = child
+                    push((child, child_depth, ipl))
+            elif choice == 1:
+                array_size = _randint(5, 20)
+                if child_depth >= max_depth:
+                    obj[key] = [_make_leaf() for _ in range(array_size)]
+                else:
+                    child_ipl = max(2, ipl // 2)
+                    arr = []
+                    obj[key] = arr
+                    for _ in range(array_size):
+                        child = {}
+                        arr.append(child)
+                        push((child, child_depth, child_ipl))
+            else:
+                obj[key] = _make_leaf()
+
+    return root
+
+
+def generate_user_columns(size=1000):
+    """Generate user data as columns (one list per field) rather than rows.
+
+    Keeping the data column-major avoids materializing a per-row dict with
+    its hash-table overhead until a row is actually needed.
+    """
+    # Bulk-generate the string columns in one draw each; the tags for all
+    # rows share a single pooled draw that is sliced by per-row counts.
+    names = random_strings_batch(size, 20)
+    emails = random_strings_batch(size, 10)
+    notes = random_strings_batch(size, 100)
+
+    if np is not None:
+        # Vectorized numeric columns (see random_strings_batch for strings)
+        ages = _np_rng.integers(18, 81, size=size).tolist()
+        actives = (_np_rng.integers(0, 2, size=size) == 1).tolist()
+        balances = np.round(_np_rng.random(size) * 10000, 2).tolist()
+        tag_counts = _np_rng.integers(3, 11, size=size).tolist()
+        months = _np_rng.integers(1, 13, size=(size, 2)).tolist()
+        days = _np_rng.integers(1, 29, size=(size, 2)).tolist()
+    else:
+        # Hoist the random-module attribute lookups out of the comprehensions
+        _randint = random.randint
+        _random = random.random
+        _getrandbits = random.getrandbits
+        ages = [_randint(18, 80) for _ in range(size)]
+        actives = [bool(_getrandbits(1)) for _ in range(size)]
+        balances = [round(_random() * 10000, 2) for _ in range(size)]
+        tag_counts = [_randint(3, 10) for _ in range(size)]
+        months = [(_randint(1, 12), _randint(1, 12)) for _ in range(size)]
+        days = [(_randint(1, 28), _randint(1, 28)) for _ in range(size)]
+
+    tags = []
+    tags_pool = random_strings_batch(sum(tag_counts), 8)
+    offset = 0
+    for count in tag_counts:
+        tags.append(tags_pool[offset:offset + count])
+        offset += count
+
+    return {
+        "names": names,
+        "emails": emails,
+        "notes": notes,
+        "ages": ages,
+        "actives": actives,
+        "balances": balances,
+        "tags": tags,
+        "months": months,
+        "days": days,
+    }
+
+
+def user_row(columns, i):
+    """Assemble row `i` from generated user columns."""
+    months = columns["months"][i]
+    days = columns["days"][i]
+    return {
+        "id": i,
+        "name": columns["names"][i],
+        "email": f"{columns['emails'][i]}@example.com",
+        "age": columns["ages"][i],
+        "active": columns["actives"][i],
+        "balance": columns["balances"][i],
+        "tags": columns["tags"][i],
+        "metadata": {
+            "created": "2024-" + _PAD2[months[0]] + "-" + _PAD2[days[0]],
+            "updated": "2024-" + _PAD2[months[1]] + "-" + _PAD2[days[1]],
+            "notes": columns["notes"][i]
+        }
+    }
 
 
-def generate_large_array(size=1000):
+def generate_large_array(size: int = 1000) -> list:
     """Generate a large array."""
-    return [
-        {
-            "id": i,
-            "name": random_string(20),
-            "email": f"{random_string(10)}@example.com",
-            "age": random.randint(18, 80),
-            "active": random.choice([True, False]),
-            "balance": round(random.random() * 10000, 2),
-            "tags": [random_string(8) for _ in range(random.randint(3, 10))],
-            "metadata": {
-                "created": f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
-                "updated": f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
-                "notes": random_string(100)
-            }
-        }
-        for i in range(size)
-    ]
+    columns = generate_user_columns(size)
+    return [user_row(columns, i) for i in range(size)]
 
 
-def generate_test_file(filename, target_size_mb, structure='mixed'):
-    """Generate a test JSON file of approximately target size."""
-    print(f"Generating {filename} (target: ~{target_size_mb} MB, structure: {structure})...")
-
-    target_size_bytes = target_size_mb * 1024 * 1024
-    data = {}
+def _build_binary_data(structure, target_size_bytes, packb):
+    """Accumulate test data in memory, sized by its compact binary encoding.
 
+    Used for the binary output formats, where the file is written in one
+    final packb call rather than streamed as JSON text.
+    """
     if structure == 'nested':
-        # Deep nested structure
-        items_per_level = 20
-        max_depth = 8
+        data = {}
+        current_size = 0
         section_count = 0
-
-        while True:
+        while current_size < target_size_bytes:
             section_count += 1
-            data[f"section_{section_count}"] = generate_nested_object(0, max_depth, items_per_level)
+            section = generate_nested_object(0, 8, 20)
+            data[f"section_{section_count}"] = section
+            current_size += len(packb(section))
+        return data
 
-            # Check size
-            test_json = json.dumps(data, indent=2)
-            current_size = len(test_json.encode('utf-8'))
+    if structure == 'array':
+        data = []
+        current_size = 0
+        while current_size < target_size_bytes:
+            batch = generate_large_array(1000)
+            data.extend(batch)
+            current_size += len(packb(batch))
+        return data
+
+    # mixed
+    data = {
+        "users": generate_large_array(5000),
+        "config": generate_nested_object(0, 6, 15),
+        "metadata": {
+            "version": "1.0",
+            "generated": "2024-01-01",
+            "description": "Test data for JSON editor"
+        },
+        "logs": []
+    }
+    logs = data["logs"]
+    current_size = len(packb(data))
+    _randint = random.randint
+    _choice = random.choice
+    while current_size < target_size_bytes:
+        entry = {
+            "id": len(logs),
+            "timestamp": ("2024-01-01T" + _PAD2[_randint(0, 23)] + ":"
+                          + _PAD2[_randint(0, 59)] + ":" + _PAD2[_randint(0, 59)]),
+            "level": _choice(["INFO", "WARNING", "ERROR", "DEBUG"]),
+            "message": random_string(100),
+            "details": generate_nested_object(0, 3, 5)
+        }
+        logs.append(entry)
+        current_size += len(packb(entry))
+    return data
 
-            if current_size >= target_size_bytes:
-                break
 
-            if section_count % 10 == 0:
-                print(f"  Progress: {current_size / 1024 / 1024:.1f} MB / {target_size_mb} MB")
+# Replacement pads for dump_fragment, built once per nesting depth
+_INDENT_PADS = [b'\n' + b'  ' * level for level in range(4)]
 
-    elif structure == 'array':
-        # Large flat array
-        batch_size = 1000
-        data = []
 
-        while True:
-            data.extend(generate_large_array(batch_size))
+def dump_fragment(obj, indent_level=1):
+    """Serialize a fragment to UTF-8 bytes, re-indented for the given depth."""
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return data.replace(b'\n', _INDENT_PADS[indent_level])
+
+
+class _MmapWriter:
+    """File writer backed by a pre-sized, memory-mapped output file.
+
+    Writing into the mapping skips the write() syscall and its
+    user-to-kernel copy per chunk; the kernel flushes dirty pages in the
+    background. The file is pre-sized with headroom and trimmed back to
+    the bytes actually written on close. Used for very large (--huge)
+    targets where the copy overhead becomes measurable.
+    """
+
+    # Allowance for overshoot past the target before the loop terminates
+    _HEADROOM = 64 * 1024 * 1024
+
+    def __init__(self, filename, target_size_bytes):
+        self._f = open(filename, 'w+b')
+        os.ftruncate(self._f.fileno(), target_size_bytes + self._HEADROOM)
+        self._mm = mmap.mmap(self._f.fileno(), 0)
+        self._pos = 0
+
+    def write(self, data):
+        pos = self._pos
+        end = pos + len(data)
+        if end > len(self._mm):
+            # Ran past the headroom; grow the file and remap
+            self._mm.close()
+            os.ftruncate(self._f.fileno(), end + self._HEADROOM)
+            self._mm = mmap.mmap(self._f.fileno(), 0)
+        self._mm[pos:end] = data
+        self._pos = end
+        return len(data)
+
+    def __enter__(self):
+        return self
 
-            # Check size
-            test_json = json.dumps(data, indent=2)
-            current_size = len(test_json.encode('utf-8'))
+    def __exit__(self, *exc):
+        self._mm.flush()
+        self._mm.close()
+        self._f.truncate(self._pos)
+        self._f.close()
 
-            if current_size >= target_size_bytes:
-                break
 
-            if len(data) % 10000 == 0:
-                print(f"  Progress: {current_size / 1024 / 1024:.1f} MB / {target_size_mb} MB ({len(data)} items)")
+# Targets at or above this size write through a memory mapping
+_MMAP_THRESHOLD = 1024 * 1024 * 1024
 
-    else:  # mixed
-        # Mix of structures
-        data = {
-            "users": generate_large_array(5000),
-            "config": generate_nested_object(0, 6, 15),
-            "logs": [],
-            "metadata": {
+
+def generate_test_file(filename: str, target_size_mb: float, structure: str = 'mixed',
+                       output_format: str = 'json') -> None:
+    """Generate a test file of approximately target size."""
+    print(f"Generating {filename} (target: ~{target_size_mb} MB, structure: {structure})...")
+
+    target_size_bytes = target_size_mb * 1024 * 1024
+
+    if output_format != 'json':
+        # Binary fast path: compact binary encodings are several times
+        # faster to serialize and smaller on disk than indented JSON
+        if output_format == 'msgpack':
+            if msgpack is None:
+                raise RuntimeError("msgpack is not installed (pip install msgpack)")
+            packb = msgpack.packb
+        elif output_format == 'cbor':
+            if cbor2 is None:
+                raise RuntimeError("cbor2 is not installed (pip install cbor2)")
+            packb = cbor2.dumps
+        else:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        data = _build_binary_data(structure, target_size_bytes, packb)
+        with open(filename, 'wb', buffering=16 * 1024 * 1024) as f:
+            f.write(packb(data))
+
+        final_size = os.path.getsize(filename)
+        print(f"  Complete! Final size: {final_size / 1024 / 1024:.2f} MB")
+        print()
+        return
+
+    # Stream fragments to disk as they are generated instead of accumulating
+    # the whole structure in memory and serializing it in one final pass.
+    # Peak memory stays proportional to one fragment, not the output file.
+    # Binary mode with a large buffer batches syscalls and skips the
+    # text-layer UTF-8 encoder (orjson fragments are already bytes).
+    # Very large targets bypass write() entirely via a memory mapping.
+    if target_size_bytes >= _MMAP_THRESHOLD:
+        out = _MmapWriter(filename, int(target_size_bytes))
+    else:
+        out = open(filename, 'wb', buffering=16 * 1024 * 1024)
+    with out as f:
+        if structure == 'nested':
+            # Deep nested structure
+            items_per_level = 20
+            max_depth = 8
+            section_count = 0
+            current_size = f.write(b'{\n')
+            last_progress = time.monotonic()
+
+            while True:
+                section_count += 1
+                section = generate_nested_object(0, max_depth, items_per_level)
+                if section_count > 1:
+                    current_size += f.write(b',\n')
+                current_size += f.write(f'  "section_{section_count}": '.encode('utf-8'))
+                current_size += f.write(dump_fragment(section))
+
+                if current_size >= target_size_bytes:
+                    break
+
+                # Throttle progress output to roughly once per second
+                now = time.monotonic()
+                if now - last_progress >= 1.0:
+                    last_progress = now
+                    print(f"  Progress: {current_size / 1024 / 1024:.1f} MB / {target_size_mb} MB")
+
+            f.write(b'\n}')
+
+        elif structure == 'array':
+            # Large flat array
+            batch_size = 1000
+            item_count = 0
+            current_size = f.write(b'[\n')
+            last_progress = time.monotonic()
+
+            while True:
+                # Generate column-major, then assemble each row only for the
+                # moment it is serialized - no batch list of row dicts
+                columns = generate_user_columns(batch_size)
+                for i in range(batch_size):
+                    if item_count > 0:
+                        current_size += f.write(b',\n')
+                    current_size += f.write(b'  ')
+                    current_size += f.write(dump_fragment(user_row(columns, i)))
+                    item_count += 1
+
+                if current_size >= target_size_bytes:
+                    break
+
+                # Throttle progress output to roughly once per second
+                now = time.monotonic()
+                if now - last_progress >= 1.0:
+                    last_progress = now
+                    print(f"  Progress: {current_size / 1024 / 1024:.1f} MB / {target_size_mb} MB ({item_count} items)")
+
+            f.write(b'\n]')
+
+        else:  # mixed
+            # Mix of structures: the fixed sections are written first, then
+            # log entries are streamed until the target size is reached
+            # ("logs" is emitted last so it can grow open-ended)
+            current_size = f.write(b'{\n')
+            current_size += f.write(b'  "users": ')
+            current_size += f.write(dump_fragment(generate_large_array(5000)))
+            current_size += f.write(b',\n  "config": ')
+            current_size += f.write(dump_fragment(generate_nested_object(0, 6, 15)))
+            current_size += f.write(b',\n  "metadata": ')
+            current_size += f.write(dump_fragment({
                 "version": "1.0",
                 "generated": "2024-01-01",
                 "description": "Test data for JSON editor"
-            }
-        }
-
-        # Add log entries
-        log_count = 0
-        while True:
-            data["logs"].append({
-                "id": log_count,
-                "timestamp": f"2024-01-01T{random.randint(0, 23):02d}:{random.randint(0, 59):02d}:{random.randint(0, 59):02d}",
-                "level": random.choice(["INFO", "WARNING", "ERROR", "DEBUG"]),
-                "message": random_string(100),
-                "details": generate_nested_object(0, 3, 5)
-            })
-            log_count += 1
-
-            if log_count % 1000 == 0:
-                test_json = json.dumps(data, indent=2)
-                current_size = len(test_json.encode('utf-8'))
+            }))
+            current_size += f.write(b',\n  "logs": [\n')
+
+            log_count = 0
+            log_batch = 1000
+            last_progress = time.monotonic()
+            _randint = random.randint
+            _choice = random.choice
+            while True:
+                # Build each batch into a preallocated chunk (index-assign
+                # instead of repeated list.append growth), then emit it
+                chunk = [None] * log_batch
+                for i in range(log_batch):
+                    chunk[i] = {
+                        "id": log_count + i,
+                        "timestamp": ("2024-01-01T" + _PAD2[_randint(0, 23)] + ":"
+                                      + _PAD2[_randint(0, 59)] + ":" + _PAD2[_randint(0, 59)]),
+                        "level": _choice(["INFO", "WARNING", "ERROR", "DEBUG"]),
+                        "message": random_string(100),
+                        "details": generate_nested_object(0, 3, 5)
+                    }
+
+                for entry in chunk:
+                    if log_count > 0:
+                        current_size += f.write(b',\n')
+                    current_size += f.write(b'    ')
+                    current_size += f.write(dump_fragment(entry, indent_level=2))
+                    log_count += 1
 
                 if current_size >= target_size_bytes:
                     break
 
-                if log_count % 5000 == 0:
+                # Throttle progress output to roughly once per second
+                now = time.monotonic()
+                if now - last_progress >= 1.0:
+                    last_progress = now
                     print(f"  Progress: {current_size / 1024 / 1024:.1f} MB / {target_size_mb} MB")
 
-    # Write to file
-    print(f"  Writing to file...")
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(b'\n  ]\n}')
 
     # Report final size
-    import os
     final_size = os.path.getsize(filename)
     print(f"  Complete! Final size: {final_size / 1024 / 1024:.2f} MB")
     print()
@@ -165,28 +480,51 @@ def main():
     print("JSON Test File Generator")
     print("========================\n")
 
+    args = sys.argv[1:]
+
+    # Optional binary output format: --format {json,msgpack,cbor}
+    output_format = 'json'
+    if '--format' in args:
+        try:
+            output_format = args[args.index('--format') + 1]
+        except IndexError:
+            print("Usage: python generate_test_json.py [--huge] [--format {json,msgpack,cbor}]")
+            return
+        if output_format not in ('json', 'msgpack', 'cbor'):
+            print(f"Unknown format: {output_format} (expected json, msgpack or cbor)")
+            return
+
+    extension = 'json' if output_format == 'json' else output_format
+
     # Generate test files of various sizes
     test_files = [
-        ("test_small.json", 1, "mixed"),          # 1 MB - quick test
-        ("test_medium.json", 10, "nested"),       # 10 MB - medium nested
-        ("test_large_array.json", 50, "array"),   # 50 MB - large array
-        ("test_large_mixed.json", 100, "mixed"),  # 100 MB - mixed structure
+        (f"test_small.{extension}", 1, "mixed"),          # 1 MB - quick test
+        (f"test_medium.{extension}", 10, "nested"),       # 10 MB - medium nested
+        (f"test_large_array.{extension}", 50, "array"),   # 50 MB - large array
+        (f"test_large_mixed.{extension}", 100, "mixed"),  # 100 MB - mixed structure
     ]
 
     # Optional: Generate 2GB file if requested
-    if len(sys.argv) > 1 and sys.argv[1] == "--huge":
-        test_files.append(("test_huge.json", 2048, "mixed"))  # 2 GB
+    if "--huge" in args:
+        test_files.append((f"test_huge.{extension}", 2048, "mixed"))  # 2 GB
         print("WARNING: Generating 2GB file. This will take several minutes...")
         print()
 
-    for filename, size, structure in test_files:
-        try:
-            generate_test_file(filename, size, structure)
-        except KeyboardInterrupt:
-            print("\nInterrupted by user")
-            break
-        except Exception as e:
-            print(f"Error generating {filename}: {e}\n")
+    # Generate the files in parallel - each file gets its own worker
+    # process, so the CPU-bound generators do not contend on the GIL
+    try:
+        with ProcessPoolExecutor(max_workers=len(test_files)) as executor:
+            futures = {
+                executor.submit(generate_test_file, filename, size, structure, output_format): filename
+                for filename, size, structure in test_files
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error generating {futures[future]}: {e}\n")
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
 
     print("Generation complete!")
     print("\nTo generate a 2GB test file, run:")
@@ -1,49 +1,282 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import array
+import io
 import json
-import ijson
+try:
+    # The yajl2_c backend parses roughly 5-10x faster than ijson's
+    # pure-Python fallback
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    import ijson
+import mmap
+try:
+    from tkinterdnd2 import DND_FILES, TkinterDnD
+except ImportError:
+    # Cross-platform drag-and-drop is optional; without tkinterdnd2 only
+    # the native macOS hook below is available.
+    TkinterDnD = None
+    DND_FILES = None
+try:
+    import orjson
+except ImportError:
+    # orjson parses/serializes in C several times faster than stdlib json;
+    # everything falls back to the json module without it.
+    orjson = None
 import os
+import sys
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 import threading
+import time
 import platform
 
 
-class JSONNode:
-    """Represents a node in the JSON tree structure."""
+# Single-pass cleanup table for _fix_json_formatting: drops ASCII control
+# characters (illegal in raw JSON strings, with tab/newline kept) and
+# normalizes stray carriage returns and typographic quotes
+_CLEANUP_TABLE = str.maketrans({
+    **{c: None for c in map(chr, range(0x20)) if c not in ('\t', '\n', '\r')},
+    '\r': '\n',
+    '\u201c': '"', '\u201d': '"',
+    '\u2018': "'", '\u2019': "'",
+})
+
+# Precompiled patterns for the JSON cleanup/conversion helpers
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_SINGLE_QUOTED_RE = re.compile(r"(?<!\\)'((?:[^'\\]|\\.)*)'")
+_JSON_LITERAL_RE = re.compile(r'\b(?:True|False|None)\b')
+_JSON_LITERAL_MAP = {'True': 'true', 'False': 'false', 'None': 'null'}
+
+
+@lru_cache(maxsize=256)
+def _compile_search_pattern(term):
+    """Compile a user search pattern, cached so repeated searches reuse it."""
+    return re.compile(term, re.IGNORECASE)
+
+
+def _requote_match(m):
+    """Turn one single-quoted token into a valid double-quoted JSON string."""
+    # \' is not a legal JSON escape once the delimiters change, and bare
+    # double quotes inside the token must now be escaped
+    body = m.group(1).replace("\\'", "'").replace('"', '\\"')
+    return '"' + body + '"'
+
+
+def _leaf_display(value) -> str:
+    """Truncated display text for a leaf, as shown in the tree."""
+    if isinstance(value, str):
+        return value[:100] + "..." if len(value) > 100 else value
+    if type(value) is float or type(value) is bool or value is None:
+        # Always short; skip the length check (ints can be arbitrarily
+        # long, so they take the general branch below)
+        return str(value)
+    s = str(value)
+    return s[:100] + "..." if len(s) > 100 else s
+
+
+def _materialize_path(cons) -> List[str]:
+    """Unroll a (parent, segment) cons chain into a root-first path list.
+
+    The deep-search walk shares path prefixes between siblings as nested
+    2-tuples; the full list is only built here, when a match is recorded.
+    """
+    parts = []
+    while cons is not None:
+        cons, seg = cons
+        parts.append(seg)
+    parts.reverse()
+    return parts
+
+
+# Shared stdlib encoders for the no-orjson fallbacks: one JSONEncoder
+# instance per format instead of a fresh one inside every dumps call
+_JSON_ENCODER_COMPACT = json.JSONEncoder(ensure_ascii=False)
+_JSON_ENCODER_PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _encode_json_value(value: Any) -> bytes:
+    """Compactly encode a single value, via orjson's C serializer when present."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # types orjson cannot serialize fall back to stdlib
+    return _JSON_ENCODER_COMPACT.encode(value).encode('utf-8')
+
+
+def _assemble_json_array(blobs) -> bytes:
+    """Join pre-encoded item blobs into a JSON array document."""
+    return b'[\n' + b',\n'.join(blobs) + b'\n]'
+
+
+def _assemble_json_object(pair_blobs) -> bytes:
+    """Join pre-encoded single-pair object blobs into one JSON object.
+
+    Each blob is the encoding of {key: value}; stripping the outer braces
+    leaves the '"key": value' member, so members concatenate directly.
+    """
+    return b'{\n' + b',\n'.join(b[1:-1] for b in pair_blobs) + b'\n}'
+
 
-    def __init__(self, key: str, value: Any, parent=None, node_type: str = "value"):
-        self.key = key
-        self.value = value
-        self.parent = parent
-        self.children = []
-        self.node_type = node_type  # 'object', 'array', 'value'
-        self.loaded = False
-        self.tree_id = None
+# Reusable decoder for apply_changes: raw_decode stops at the end of the
+# first JSON value instead of scanning the whole string before rejecting it
+_VALUE_DECODER = json.JSONDecoder()
 
-    def get_path(self) -> List[str]:
+
+def _dumps_pretty(value: Any) -> str:
+    """Pretty-print a value as 2-space-indented JSON, via orjson when present."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # types orjson cannot serialize fall back to stdlib
+    return _JSON_ENCODER_PRETTY.encode(value)
+
+
+def _write_bytes(file_path: str, payload: bytes) -> None:
+    """Write a serialized document to disk in large unbuffered chunks.
+
+    An unbuffered handle plus 4MB memoryview slices writes straight from
+    the payload with no intermediate buffer copy.
+    """
+    chunk = 4 << 20
+    with open(file_path, 'wb', buffering=0) as f, memoryview(payload) as view:
+        for i in range(0, len(view), chunk):
+            f.write(view[i:i + chunk])
+
+
+def _write_json_file(file_path: str, data: Any) -> None:
+    """Write data as indented JSON, using orjson's C serializer when present.
+
+    Writes to a sibling temp file and renames it into place, so an
+    interrupted save never leaves a truncated document behind.
+    """
+    tmp_path = file_path + '.tmp'
+    try:
+        if orjson is not None:
+            _write_bytes(tmp_path, orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                # encode() once and write whole, rather than json.dump's many
+                # small iterencode writes
+                f.write(_JSON_ENCODER_PRETTY.encode(data))
+        os.replace(tmp_path, file_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _parse_json_worker(text):
+    """Strict JSON parse run in a worker process (module level so it pickles).
+
+    Returns (True, data) on success and (False, None) on parse failure;
+    the caller redoes a failing parse in-process to get a JSONDecodeError
+    with full position info, since decode exceptions do not unpickle
+    cleanly across process boundaries.
+    """
+    try:
+        if orjson is not None:
+            return True, orjson.loads(text)
+        return True, json.loads(text)
+    except ValueError:
+        return False, None
+
+
+class JSONModel:
+    """Struct-of-arrays model of the JSON tree.
+
+    One object per node costs ~100 bytes of PyObject overhead and
+    scatters allocations across the heap; parallel arrays indexed by an
+    integer node id keep the same information compact and contiguous, so
+    bulk operations (search, expand-all) iterate arrays instead of
+    chasing pointers.
+    """
+
+    # Node type codes, stored as int8 instead of compared as strings
+    TYPE_VALUE = 0
+    TYPE_OBJECT = 1
+    TYPE_ARRAY = 2
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.values: List[Any] = []
+        self.parent = array.array('i')      # parent node id, -1 for root
+        self.node_type = array.array('b')   # TYPE_* code
+        self.loaded = bytearray()           # 1 once children are materialized
+        self.tree_id: List[Optional[str]] = []  # Treeview iid, once inserted
+        self.children: List[List[int]] = []
+        self.display_cache: List[Optional[str]] = []
+
+    def add_node(self, key: str, value: Any, parent_id: int = -1,
+                 type_code: int = TYPE_VALUE) -> int:
+        """Append a node and return its integer id."""
+        node_id = len(self.keys)
+        self.keys.append(key)
+        self.values.append(value)
+        self.parent.append(parent_id)
+        self.node_type.append(type_code)
+        self.loaded.append(0)
+        self.tree_id.append(None)
+        self.children.append([])
+        self.display_cache.append(None)
+        if parent_id >= 0:
+            self.children[parent_id].append(node_id)
+        return node_id
+
+    def get_path(self, node_id: int) -> List[str]:
         """Get the full path from root to this node."""
         path = []
-        current = self
-        while current.parent is not None:
-            path.insert(0, current.key)
-            current = current.parent
+        keys = self.keys
+        parent = self.parent
+        while parent[node_id] >= 0:
+            path.append(keys[node_id])
+            node_id = parent[node_id]
+        path.reverse()
         return path
 
-    def get_display_value(self) -> str:
-        """Get the display string for this node."""
-        if self.node_type == 'object':
-            count = len(self.children) if self.loaded else '?'
-            return f"{self.key} {{{count}}}"
-        elif self.node_type == 'array':
-            count = len(self.children) if self.loaded else '?'
-            return f"{self.key} [{count}]"
+    def get_display_value(self, node_id: int) -> str:
+        """Get the display string for this node (cached per node)."""
+        cached = self.display_cache[node_id]
+        if cached is not None:
+            return cached
+
+        key = self.keys[node_id]
+        node_type = self.node_type[node_id]
+        if node_type == self.TYPE_OBJECT:
+            count = len(self.children[node_id]) if self.loaded[node_id] else '?'
+            display = f"{key} {{{count}}}"
+        elif node_type == self.TYPE_ARRAY:
+            count = len(self.children[node_id]) if self.loaded[node_id] else '?'
+            display = f"{key} [{count}]"
         else:
-            # Truncate long values
-            val_str = str(self.value)
-            if len(val_str) > 100:
-                val_str = val_str[:100] + "..."
-            return f"{self.key}: {val_str}"
+            # Truncate long values; slice strings before any conversion so
+            # a multi-MB leaf never materializes a full copy just to show
+            # its first 100 characters
+            value = self.values[node_id]
+            if isinstance(value, str):
+                val_str = value[:100] + "..." if len(value) > 100 else value
+            else:
+                val_str = str(value)
+                if len(val_str) > 100:
+                    val_str = val_str[:100] + "..."
+            display = f"{key}: {val_str}"
+
+        self.display_cache[node_id] = display
+        return display
+
+    def invalidate_display(self, node_id: int) -> None:
+        """Drop the cached display string after a node's value changes."""
+        self.display_cache[node_id] = None
 
 
 class LazyJSONLoader:
@@ -51,75 +284,168 @@ class LazyJSONLoader:
 
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.file_size = os.path.getsize(file_path)
-        self._cache = {}
+        # One open + fstat up front instead of a stat call plus a fresh
+        # open() in every method
+        self._fd = os.open(file_path, os.O_RDONLY)
+        self.file_size = os.fstat(self._fd).st_size
+        if hasattr(os, 'posix_fadvise'):
+            # Tell the kernel the first parse will read straight through,
+            # so it prefetches aggressively on a cold cache
+            os.posix_fadvise(self._fd, 0, self.file_size, os.POSIX_FADV_SEQUENTIAL)
+        self._root = None  # already-parsed tree shared via set_root()
+        # Per-instance bounded caches. Built here rather than decorating
+        # the methods so the cache key never includes (or retains) self.
+        self._full = lru_cache(maxsize=1)(self._parse_full)
+        self._load_path = lru_cache(maxsize=256)(self._resolve_path)
+
+    def _mmap(self):
+        """Map the file read-only.
+
+        The OS pages the file in on demand and can drop clean pages under
+        pressure, so peak RSS stays near the working set instead of the
+        ~2x file size that read() plus parse would hold.
+        """
+        mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            # The parse reads straight through the mapping, so ask the
+            # kernel for aggressive readahead and immediate prefetch; a
+            # cold-cache parse then overlaps disk reads with parsing
+            # instead of faulting one page cluster at a time.
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            if hasattr(mmap, 'MADV_WILLNEED'):
+                mm.madvise(mmap.MADV_WILLNEED)
+        return mm
+
+    def close(self):
+        """Release the file descriptor backing the memory maps."""
+        self._root = None
+        self.clear_cache()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        # Last-resort cleanup if an instance is dropped without close()
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def load_full_json(self) -> Any:
         """Load the entire JSON file (use cautiously with large files)."""
-        with open(self.file_path, 'r', encoding='utf-8') as f:
+        return self._full()
+
+    def set_root(self, data: Any) -> None:
+        """Share an already-parsed tree so lookups never re-parse the file."""
+        self._root = data
+        self.clear_cache()
+
+    def _parse_full(self) -> Any:
+        """Parse the whole file; memoized through self._full."""
+        if self._root is not None:
+            return self._root
+        if orjson is not None:
+            # orjson takes the mapped buffer directly (via memoryview),
+            # so the file is never copied into a Python bytes object
+            with self._mmap() as mm:
+                return orjson.loads(memoryview(mm))
+        # Binary mode with a 1 MiB buffer: far fewer read() syscalls than
+        # the default 8 KiB text buffering, and json handles the UTF-8
+        with open(self.file_path, 'rb', buffering=1024 * 1024) as f:
             return json.load(f)
 
     def load_partial_json(self, max_depth: int = 2) -> Any:
         """Load JSON up to a certain depth using streaming."""
-        with open(self.file_path, 'rb') as f:
-            # For initial load, we'll load the full structure but lazily
-            parser = ijson.parse(f)
+        # 1 MiB buffer: ijson pulls many small reads from the handle
+        with open(self.file_path, 'rb', buffering=1024 * 1024) as f:
+            # For initial load, we'll load the full structure but lazily;
+            # buf_size matches the file buffer so the backend drains it
+            # in one gulp per refill instead of its 64 KiB default
+            parser = ijson.parse(f, buf_size=1024 * 1024)
             return self._build_structure(parser, max_depth)
 
-    def _build_structure(self, parser, max_depth: int, current_depth: int = 0):
-        """Build a partial JSON structure from streaming parser."""
+    @staticmethod
+    def _build_structure(parser, max_depth: int, current_depth: int = 0):
+        """Build a partial JSON structure from streaming parser.
+
+        Containers nested deeper than max_depth become placeholder
+        sentinels and their events are drained without building children,
+        so memory stays bounded by the truncated tree rather than the
+        whole document.
+        """
         result = None
-        stack = []
+        stack = []  # open containers, innermost last; depth == len(stack)
+        key = None  # pending map key for the innermost open dict
 
         for prefix, event, value in parser:
-            if current_depth >= max_depth:
-                # Stop parsing at max depth
-                if event == 'map_key':
-                    return {"...": "Content not loaded"}
-                elif event == 'start_array':
-                    return ["..."]
-
-            # This is a simplified version - full implementation would be more complex
-            if event == 'start_map':
-                if result is None:
-                    result = {}
-                    stack.append(result)
-            elif event == 'end_map':
+            if event == 'map_key':
+                key = value
+            elif event == 'start_map' or event == 'start_array':
+                truncated = len(stack) >= max_depth
+                if truncated:
+                    # Too deep: attach a placeholder and skip the subtree
+                    node = {"...": "Content not loaded"} if event == 'start_map' else ["..."]
+                    open_count = 1
+                    for _, ev, _val in parser:
+                        if ev == 'start_map' or ev == 'start_array':
+                            open_count += 1
+                        elif ev == 'end_map' or ev == 'end_array':
+                            open_count -= 1
+                            if open_count == 0:
+                                break
+                else:
+                    node = {} if event == 'start_map' else []
+
                 if stack:
-                    stack.pop()
-            elif event == 'start_array':
-                if result is None:
-                    result = []
-                    stack.append(result)
-            elif event == 'end_array':
+                    container = stack[-1]
+                    if isinstance(container, dict):
+                        container[key] = node
+                    else:
+                        container.append(node)
+                else:
+                    result = node
+
+                if not truncated:
+                    stack.append(node)
+            elif event == 'end_map' or event == 'end_array':
                 if stack:
                     stack.pop()
+            else:
+                # Scalar value (string/number/boolean/null)
+                if stack:
+                    container = stack[-1]
+                    if isinstance(container, dict):
+                        container[key] = value
+                    else:
+                        container.append(value)
+                else:
+                    result = value
 
         return result
 
     def get_value_at_path(self, path: List[str]) -> Any:
         """Get a specific value at a given path in the JSON."""
-        cache_key = '.'.join(path)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # Stream through the file to find the specific path
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            current = data
-            for key in path:
-                if isinstance(current, dict):
-                    current = current.get(key)
-                elif isinstance(current, list):
-                    try:
-                        current = current[int(key)]
-                    except (ValueError, IndexError):
-                        return None
-                else:
+        return self._load_path(tuple(path))
+
+    def _resolve_path(self, path: Tuple[str, ...]) -> Any:
+        """Walk the memoized parse; memoized per path through self._load_path."""
+        current = self._full()
+        for key in path:
+            if isinstance(current, dict):
+                current = current.get(key)
+            elif isinstance(current, list):
+                try:
+                    current = current[int(key)]
+                except (ValueError, IndexError):
                     return None
+            else:
+                return None
+        return current
 
-            self._cache[cache_key] = current
-            return current
+    def clear_cache(self):
+        """Drop the memoized parse and path lookups."""
+        self._full.cache_clear()
+        self._load_path.cache_clear()
 
 
 class JSONEditorGUI:
@@ -141,6 +467,27 @@ class JSONEditorGUI:
         self.modified = False
         self.root_node = None
         self.use_regex = False
+        # Raw JSON subtree and tag tuple per Treeview iid, recorded at
+        # insert time so lookups are dict accesses instead of Tk roundtrips
+        self._iid_value = {}
+        self._iid_tags = {}
+        # Deferred children hidden behind a '... Show N more' placeholder
+        self._more_items = {}
+        # Raw path tuple per iid (str keys, int list indices), recorded at
+        # insert time; avoids re-deriving paths by splitting display text
+        self._iid_path = {}
+        self._parse_pool = None  # lazy single-worker pool for huge pastes
+        # Parsed documents from recent loads, keyed (path, mtime, size) so
+        # a reopened unchanged file skips the parse entirely; LRU capped
+        self._parse_cache = {}
+        self._search_pool = None  # lazy single-worker thread for deep search
+        self._search_job = None  # pending debounced search callback id
+        # Screen size rarely changes; cache it for dialog centering
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
+        # Remembered oversized-item decision while a split is running
+        self._bulk_oversize_choice = None
+        self._expand_job = None  # pending expand/collapse slice, if any
 
         # Detect platform for keyboard shortcuts
         self.is_mac = platform.system() == 'Darwin'
@@ -338,7 +685,14 @@ class JSONEditorGUI:
         self.context_menu.add_command(label="Go to Node", command=self.goto_node)
 
     def _setup_drag_and_drop(self):
-        """Setup drag and drop functionality using native macOS support."""
+        """Setup drag and drop functionality for files."""
+        if TkinterDnD is not None and hasattr(self.root, 'drop_target_register'):
+            # Cross-platform drop support via tkinterdnd2 (requires the
+            # root window to be a TkinterDnD.Tk, as created in main)
+            self.root.drop_target_register(DND_FILES)
+            self.root.dnd_bind('<<Drop>>', self._handle_dnd_drop)
+            return
+
         if self.is_mac:
             # On macOS, we can use the native file drop support
             # Register the window to accept file drops
@@ -346,17 +700,23 @@ class JSONEditorGUI:
                 # Use Tcl/Tk's native drag and drop on macOS
                 self.root.tk.call('::tk::mac::addFileDropHandling',
                                  self.root._w,
-                                 self.root.register(self._handle_mac_file_drop))
+                                 self.root.register(self._handle_file_drop))
             except Exception as e:
                 print(f"Note: macOS drag-and-drop registration failed: {e}")
                 print("You can still open files using the 'Open File' button.")
         else:
             # For other platforms, provide a message
-            print("Note: Drag and drop is currently only supported on macOS.")
+            print("Note: Drag and drop requires the tkinterdnd2 package.")
             print("Use the 'Open File' button to load JSON files.")
 
-    def _handle_mac_file_drop(self, *files):
-        """Handle file drop event on macOS."""
+    def _handle_dnd_drop(self, event):
+        """Handle a tkinterdnd2 <<Drop>> event."""
+        # event.data is a Tcl list; braces quote paths containing spaces
+        files = self.root.tk.splitlist(event.data)
+        self._handle_file_drop(*files)
+
+    def _handle_file_drop(self, *files):
+        """Handle dropped files (shared by the macOS and tkinterdnd2 paths)."""
         if not files:
             return
 
@@ -421,8 +781,7 @@ class JSONEditorGUI:
             return
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(value, f, indent=2, ensure_ascii=False)
+            _write_json_file(file_path, value)
 
             messagebox.showinfo("Success", f"Node saved to:\n{file_path}")
         except Exception as e:
@@ -473,8 +832,15 @@ class JSONEditorGUI:
             self.tree.selection_set(item)
             self.tree.focus(item)
             self.tree.see(item)
-            # Expand/collapse if it's a container
-            tags = self.tree.item(item, 'tags')
+            # Expand/collapse if it's a container. Tags recorded at insert
+            # time make this a dict lookup instead of a Tk roundtrip; fall
+            # back to querying Tk for items inserted elsewhere.
+            tags = self._iid_tags.get(item)
+            if tags is None:
+                tags = self.tree.item(item, 'tags')
+            if 'more' in tags:
+                self._show_more(item)
+                return
             if 'object' in tags or 'array' in tags:
                 current_state = self.tree.item(item, 'open')
                 self.tree.item(item, open=not current_state)
@@ -491,6 +857,21 @@ class JSONEditorGUI:
 
         self._load_file(file_path)
 
+    def _parse_executor(self):
+        """Worker-process pool for parsing, created on first use.
+
+        Lazy so that importing the module (or freezing it) never forks.
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=1)
+        return self._parse_pool
+
+    def _search_executor(self):
+        """Worker thread for deep search, created on first use."""
+        if self._search_pool is None:
+            self._search_pool = ThreadPoolExecutor(max_workers=1)
+        return self._search_pool
+
     def paste_json(self):
         """Paste JSON from clipboard and load it."""
         try:
@@ -506,8 +887,10 @@ class JSONEditorGUI:
             if clipboard_text.startswith('\ufeff'):
                 clipboard_text = clipboard_text[1:]
 
-            # Show progress for large clipboard data
-            data_size_mb = len(clipboard_text.encode('utf-8')) / (1024 * 1024)
+            # Show progress for large clipboard data. Character count is a
+            # close enough size estimate for the progress threshold and
+            # avoids encoding a clipboard-sized temporary bytes object.
+            data_size_mb = len(clipboard_text) / (1024 * 1024)
 
             self.status_label.config(text="Parsing pasted JSON...")
             self.root.update()
@@ -517,6 +900,7 @@ class JSONEditorGUI:
             progress_label = None
             progress_bar = None
             progress_percentage = None
+            update_progress = None
 
             if data_size_mb > 0.5:
                 progress_window = tk.Toplevel(self.root)
@@ -544,22 +928,70 @@ class JSONEditorGUI:
                 progress_percentage = ttk.Label(progress_window, text="0%")
                 progress_percentage.pack(pady=2)
 
+                def update_progress(pct=None, text=None):
+                    # Single callback updating all three widgets: one Tk
+                    # event post per checkpoint instead of three lambdas
+                    if pct is not None:
+                        progress_bar.config(value=pct)
+                        progress_percentage.config(text=f"{pct}%")
+                    if text is not None:
+                        progress_label.config(text=text)
+
             # Parse JSON in background thread for large data
             def parse_thread():
                 try:
                     # Update progress: 10%
                     if progress_window:
-                        self.root.after(0, lambda: progress_bar.config(value=10))
-                        self.root.after(0, lambda: progress_percentage.config(text="10%"))
-                        self.root.after(0, lambda: progress_label.config(text="Parsing JSON..."))
+                        self.root.after(0, update_progress, 10, "Parsing JSON...")
+
+                    # For very large pastes, run the strict parse in a
+                    # worker process: even on a background thread the parse
+                    # holds the GIL and stalls the Tk event loop, while a
+                    # separate process leaves the UI untouched.
+                    worker_ok = False
+                    parsed_data = None
+                    if data_size_mb > 50:
+                        # Enormous paste: stream-parse with bounded memory
+                        # instead of a one-shot loads that peaks at several
+                        # times the text size. Structure below the depth
+                        # limit is replaced by placeholder sentinels.
+                        if progress_window:
+                            self.root.after(0, update_progress, None, "Stream-parsing large JSON...")
+                        buf = io.BytesIO(clipboard_text.encode('utf-8'))
+                        total_bytes = buf.getbuffer().nbytes
+
+                        def counted_events():
+                            # Real progress from bytes consumed, posted
+                            # every couple hundred thousand parse events
+                            for count, event in enumerate(ijson.parse(buf)):
+                                if progress_window and count % 200000 == 0:
+                                    pct = min(95, buf.tell() * 100 // total_bytes)
+                                    self.root.after(0, update_progress, pct)
+                                yield event
+
+                        parsed_data = LazyJSONLoader._build_structure(counted_events(), max_depth=3)
+                        worker_ok = True
+                    elif data_size_mb >= 5:
+                        try:
+                            worker_ok, parsed_data = self._parse_executor().submit(
+                                _parse_json_worker, clipboard_text).result()
+                        except Exception:
+                            worker_ok = False
 
                     # Try to parse the JSON with better error handling
+                    # (orjson's JSONDecodeError subclasses json's, so the
+                    # recovery chain below works for either parser)
                     try:
-                        parsed_data = json.loads(clipboard_text)
+                        if worker_ok:
+                            pass
+                        elif orjson is not None:
+                            parsed_data = orjson.loads(clipboard_text)
+                        else:
+                            parsed_data = json.loads(clipboard_text)
                     except json.JSONDecodeError as json_err:
                         # Try fixing common formatting issues first
                         if progress_window:
-                            self.root.after(0, lambda: progress_label.config(text="Cleaning JSON formatting..."))
+                            self.root.after(0, update_progress, None, "Cleaning JSON formatting...")
 
                         try:
                             fixed_text = self._fix_json_formatting(clipboard_text)
@@ -571,7 +1003,7 @@ class JSONEditorGUI:
                             except:
                                 # If still fails, try the quote conversion
                                 if progress_window:
-                                    self.root.after(0, lambda: progress_label.config(text="Attempting quote conversion..."))
+                                    self.root.after(0, update_progress, None, "Attempting quote conversion...")
 
                                 try:
                                     converted = self._convert_quotes(clipboard_text)
@@ -582,30 +1014,24 @@ class JSONEditorGUI:
 
                     # Update progress: 50%
                     if progress_window:
-                        self.root.after(0, lambda: progress_bar.config(value=50))
-                        self.root.after(0, lambda: progress_percentage.config(text="50%"))
-                        self.root.after(0, lambda: progress_label.config(text="Validating data structure..."))
+                        self.root.after(0, update_progress, 50, "Validating data structure...")
 
                     # Set the data
                     self.json_data = parsed_data
                     self.current_file = None  # No file yet
-                    self.loader = None
+                    self._set_loader(None)
                     self.modified = True  # Mark as modified since it's new data
 
                     # Update progress: 75%
                     if progress_window:
-                        self.root.after(0, lambda: progress_bar.config(value=75))
-                        self.root.after(0, lambda: progress_percentage.config(text="75%"))
-                        self.root.after(0, lambda: progress_label.config(text="Building tree view..."))
+                        self.root.after(0, update_progress, 75, "Building tree view...")
 
                     # Populate tree
                     self.root.after(0, self._populate_tree)
 
                     # Update progress: 100%
                     if progress_window:
-                        self.root.after(0, lambda: progress_bar.config(value=100))
-                        self.root.after(0, lambda: progress_percentage.config(text="100%"))
-                        self.root.after(0, lambda: progress_label.config(text="Complete!"))
+                        self.root.after(0, update_progress, 100, "Complete!")
 
                     self.root.after(0, lambda: self.status_label.config(
                         text="Pasted JSON loaded - Use 'Save As' to save"
@@ -697,8 +1123,13 @@ class JSONEditorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to paste JSON:\n{str(e)}")
 
-    def _handle_quote_conversion_error(self, file_path: str, error: json.JSONDecodeError):
-        """Handle JSON parse error related to quotes and offer conversion."""
+    def _handle_quote_conversion_error(self, file_path: str, error: json.JSONDecodeError,
+                                       raw_content: Optional[str] = None):
+        """Handle JSON parse error related to quotes and offer conversion.
+
+        raw_content, when provided, is the file's decoded text captured by
+        the failed load, so conversion does not re-read the file.
+        """
         response = messagebox.askyesno(
             "JSON Parse Error - Invalid Quotes",
             f"Invalid JSON format:\n{str(error)}\n\nLine {error.lineno}, Column {error.colno}\n\n"
@@ -707,18 +1138,23 @@ class JSONEditorGUI:
         )
 
         if response:
-            self._convert_and_reload_file(file_path)
+            self._convert_and_reload_file(file_path, raw_content)
         else:
             self.status_label.config(text="Error: Invalid JSON")
             self.current_file = None
             self.json_data = None
 
-    def _convert_and_reload_file(self, file_path: str):
+    def _convert_and_reload_file(self, file_path: str, raw_content: Optional[str] = None):
         """Convert single quotes to double quotes and reload the file."""
         try:
-            # Read the file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if raw_content is not None:
+                content = raw_content
+            else:
+                # Read the file content: one bulk binary read through a
+                # large buffer, decoded once, instead of chunked text-mode
+                # decoding
+                with open(file_path, 'rb', buffering=1024 * 1024) as f:
+                    content = f.read().decode('utf-8')
 
             # Convert single quotes to double quotes
             # This is a simple conversion that handles most cases
@@ -749,7 +1185,8 @@ class JSONEditorGUI:
                 # Load the data
                 self.json_data = json_data
                 self.current_file = file_path
-                self.loader = LazyJSONLoader(file_path)
+                self._set_loader(LazyJSONLoader(file_path))
+                self.loader.set_root(json_data)
                 self._populate_tree()
                 self.status_label.config(text=f"Loaded: {os.path.basename(file_path)}")
 
@@ -771,39 +1208,29 @@ class JSONEditorGUI:
 
     def _convert_quotes(self, content: str) -> str:
         """Convert single quotes to double quotes in JSON-like content."""
-        # This is a simple but effective approach for most cases
-        # It handles:
-        # - Property names in single quotes: {'key': value}
-        # - String values in single quotes: {key: 'value'}
-
-        import ast
+        # One compiled-regex pass swapping single-quoted tokens for
+        # double-quoted ones, preserving escaped characters inside. This
+        # replaces the old ast.literal_eval round-trip, which built a full
+        # Python object graph (roughly doubling memory for the duration)
+        # just to re-serialize it, and also silently re-ordered nothing it
+        # should have while choking on very large inputs.
+        converted = _SINGLE_QUOTED_RE.sub(_requote_match, content)
 
-        # Try to use Python's AST to safely evaluate and convert
-        # This works for Python dict syntax which is similar to JSON with single quotes
-        try:
-            # Replace true/false/null with Python equivalents temporarily
-            temp_content = content.replace('true', 'True').replace('false', 'False').replace('null', 'None')
-            # Try to evaluate as Python literal
-            obj = ast.literal_eval(temp_content)
-            # Convert back to JSON
-            return json.dumps(obj, indent=2, ensure_ascii=False)
-        except:
-            # Fallback: simple string replacement
-            # This is less safe but works for simple cases
-            result = content.replace("'", '"')
-            return result
+        # Python-style literals usually accompany single-quoted data
+        return _JSON_LITERAL_RE.sub(lambda m: _JSON_LITERAL_MAP[m.group()], converted)
 
     def _fix_json_formatting(self, content: str) -> str:
         """Fix common JSON formatting issues."""
-        # Remove null bytes and other control characters that can break parsing
-        content = content.replace('\x00', '')
+        # Normalize Windows line endings first so the table below only
+        # sees lone carriage returns
+        content = content.replace('\r\n', '\n')
 
-        # Normalize line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        # One C-level translate pass: drop null bytes, normalize remaining
+        # carriage returns and typographic quotes
+        content = content.translate(_CLEANUP_TABLE)
 
         # Remove any trailing commas before closing braces/brackets
-        import re
-        content = re.sub(r',(\s*[}\]])', r'\1', content)
+        content = _TRAILING_COMMA_RE.sub(r'\1', content)
 
         # Fix common escape sequence issues
         # Ensure backslashes in strings are properly escaped
@@ -840,7 +1267,23 @@ class JSONEditorGUI:
             return
 
         self.current_file = file_path
-        self.status_label.config(text=f"Loading: {os.path.basename(file_path)}...")
+        base_name = os.path.basename(file_path)
+
+        # Reopening an unchanged file: reuse the parse from a prior load
+        cache_key = (file_path, os.path.getmtime(file_path), file_size)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.pop(cache_key)  # move to most-recent slot
+            self._parse_cache[cache_key] = cached
+            self.json_data = cached
+            self._set_loader(LazyJSONLoader(file_path))
+            self.loader.set_root(cached)
+            self.file_size_label.config(text=f"Size: {size_mb:.1f} MB")
+            self._populate_tree()
+            self.status_label.config(text=f"Loaded: {base_name}")
+            return
+
+        self.status_label.config(text=f"Loading: {base_name}...")
         self.file_size_label.config(text=f"Size: {size_mb:.1f} MB")
         self.root.update()
 
@@ -849,6 +1292,7 @@ class JSONEditorGUI:
         progress_bar = None
         progress_label = None
         progress_percentage = None
+        update_progress = None
 
         if size_mb > 1:
             progress_window = tk.Toplevel(self.root)
@@ -863,7 +1307,7 @@ class JSONEditorGUI:
             y = (progress_window.winfo_screenheight() // 2) - (150 // 2)
             progress_window.geometry(f"450x150+{x}+{y}")
 
-            ttk.Label(progress_window, text=f"Loading {os.path.basename(file_path)}...",
+            ttk.Label(progress_window, text=f"Loading {base_name}...",
                      font=('Arial', 10, 'bold')).pack(pady=10)
 
             progress_label = ttk.Label(progress_window, text="Reading file...")
@@ -876,42 +1320,50 @@ class JSONEditorGUI:
             progress_percentage = ttk.Label(progress_window, text="0%")
             progress_percentage.pack(pady=2)
 
+            def update_progress(pct, text):
+                # Single callback updating all three widgets: one Tk event
+                # post per checkpoint instead of three lambdas
+                progress_bar.config(value=pct)
+                progress_percentage.config(text=f"{pct}%")
+                progress_label.config(text=text)
+
         # Load in background thread for large files
         def load_thread():
             try:
                 # Update progress: 20%
                 if progress_window:
-                    self.root.after(0, lambda: progress_bar.config(value=20))
-                    self.root.after(0, lambda: progress_percentage.config(text="20%"))
-                    self.root.after(0, lambda: progress_label.config(text="Reading file..."))
+                    self.root.after(0, update_progress, 20, "Reading file...")
 
-                self.loader = LazyJSONLoader(file_path)
+                self._set_loader(LazyJSONLoader(file_path))
 
                 # Update progress: 40%
                 if progress_window:
-                    self.root.after(0, lambda: progress_bar.config(value=40))
-                    self.root.after(0, lambda: progress_percentage.config(text="40%"))
-                    self.root.after(0, lambda: progress_label.config(text="Parsing JSON..."))
+                    self.root.after(0, update_progress, 40, "Parsing JSON...")
 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.json_data = json.load(f)
+                # Parse through the loader: orjson over the mmapped file
+                # (several times faster than json.load through text IO,
+                # with no whole-file bytes copy), memoized so later loader
+                # lookups share this parse.
+                self.json_data = self.loader.load_full_json()
+
+                # Remember the parse for quick reopens; keep only the four
+                # most recent documents
+                self._parse_cache[cache_key] = self.json_data
+                while len(self._parse_cache) > 4:
+                    self._parse_cache.pop(next(iter(self._parse_cache)))
 
                 # Update progress: 70%
                 if progress_window:
-                    self.root.after(0, lambda: progress_bar.config(value=70))
-                    self.root.after(0, lambda: progress_percentage.config(text="70%"))
-                    self.root.after(0, lambda: progress_label.config(text="Populating tree view..."))
+                    self.root.after(0, update_progress, 70, "Populating tree view...")
 
                 self.root.after(0, self._populate_tree)
 
                 # Update progress: 100%
                 if progress_window:
-                    self.root.after(0, lambda: progress_bar.config(value=100))
-                    self.root.after(0, lambda: progress_percentage.config(text="100%"))
-                    self.root.after(0, lambda: progress_label.config(text="Complete!"))
+                    self.root.after(0, update_progress, 100, "Complete!")
 
                 self.root.after(0, lambda: self.status_label.config(
-                    text=f"Loaded: {os.path.basename(file_path)}"
+                    text=f"Loaded: {base_name}"
                 ))
 
                 # Close progress window after brief delay to show 100%
@@ -927,8 +1379,20 @@ class JSONEditorGUI:
 
                 # Check if the error is related to single quotes
                 if "Expecting property name enclosed in double quotes" in error_msg or "'" in error_msg:
+                    # The failed parse already pulled the file into the page
+                    # cache; decode it from the loader's mmap here so the
+                    # conversion path does not read the file again
+                    raw_content = None
+                    try:
+                        if self.loader is not None:
+                            with self.loader._mmap() as mm:
+                                raw_content = mm[:].decode('utf-8')
+                    except (OSError, ValueError, UnicodeDecodeError):
+                        raw_content = None
+
                     # Offer to convert single quotes to double quotes
-                    self.root.after(0, lambda err=json_error: self._handle_quote_conversion_error(file_path, err))
+                    self.root.after(0, lambda err=json_error, raw=raw_content:
+                                    self._handle_quote_conversion_error(file_path, err, raw))
                 else:
                     full_error_msg = f"Invalid JSON format:\n{str(json_error)}\n\nLine {json_error.lineno}, Column {json_error.colno}"
                     self.root.after(0, lambda msg=full_error_msg: messagebox.showerror(
@@ -965,92 +1429,175 @@ class JSONEditorGUI:
                 self.current_file = None
                 self.json_data = None
 
-        thread = threading.Thread(target=load_thread, daemon=True)
-        thread.start()
+        if file_size < 1024 * 1024:
+            # Small file: thread startup and marshalling dominate the
+            # parse itself, so run the same loader inline (the after()
+            # calls inside just queue to the running mainloop)
+            load_thread()
+        else:
+            thread = threading.Thread(target=load_thread, daemon=True)
+            thread.start()
 
     def _populate_tree(self):
         """Populate the tree view with JSON data."""
         # Clear existing tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._cancel_expand_job()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._iid_value.clear()
+        self._iid_tags.clear()
+        self._more_items.clear()
+        self._iid_path.clear()
 
         if self.json_data is None:
             return
 
-        # Create root node
-        if isinstance(self.json_data, dict):
-            count = len(self.json_data)
-            root_id = self.tree.insert('', 'end', text=f'Root {{{count}}}', open=True)
-            self._add_dict_nodes(root_id, self.json_data)
-        elif isinstance(self.json_data, list):
-            count = len(self.json_data)
-            root_id = self.tree.insert('', 'end', text=f'Root [{count}]', open=True)
-            self._add_list_nodes(root_id, self.json_data)
-        else:
-            self.tree.insert('', 'end', text=f'Root: {self.json_data}')
+        # Detach the widget while inserting so Tk lays out and redraws
+        # once at the end instead of once per row, as the filtered
+        # rebuild already does
+        self.tree.pack_forget()
+        try:
+            # Create root node
+            if isinstance(self.json_data, dict):
+                count = len(self.json_data)
+                root_id = self.tree.insert('', 'end', text=f'Root {{{count}}}', open=True)
+                self._iid_value[root_id] = self.json_data
+                self._iid_path[root_id] = ()
+                self._add_dict_nodes(root_id, self.json_data)
+            elif isinstance(self.json_data, list):
+                count = len(self.json_data)
+                root_id = self.tree.insert('', 'end', text=f'Root [{count}]', open=True)
+                self._iid_value[root_id] = self.json_data
+                self._iid_path[root_id] = ()
+                self._add_list_nodes(root_id, self.json_data)
+            else:
+                self.tree.insert('', 'end', text=f'Root: {self.json_data}')
+        finally:
+            # Packed after both scrollbars, so re-packing last restores
+            # the original layout order
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     def _add_dict_nodes(self, parent_id: str, data: dict, max_items: int = 200):
         """Add dictionary nodes to tree (with lazy loading for large dicts)."""
         items = list(data.items())
 
-        # Increase max_items to 200 for better initial display
-        # Process in smaller chunks for ultra-fast response
-        chunk_size = 50
-        items_to_show = min(len(items), max_items)
-
-        for i in range(0, items_to_show, chunk_size):
-            chunk = items[i:i + chunk_size]
-            for key, value in chunk:
-                self._add_node(parent_id, key, value)
-            # Reduced update frequency for speed
-            if i + chunk_size < items_to_show and i % (chunk_size * 2) == 0:
-                self.root.update_idletasks()
+        # One uninterrupted batch: pagination caps this at max_items rows,
+        # and flushing idle tasks mid-insert only redraws half-built levels
+        self._add_nodes_batch(parent_id, items[:max_items])
 
-        # If there are more items, show all remaining items (no pagination needed for most cases)
+        # Defer the rest behind a pagination placeholder: inserting tens
+        # of thousands of rows nobody has scrolled to is pure Tcl overhead
         if len(items) > max_items:
-            for key, value in items[max_items:]:
-                self._add_node(parent_id, key, value)
+            self._add_more_placeholder(parent_id, 'dict', items, max_items)
 
     def _add_list_nodes(self, parent_id: str, data: list, max_items: int = 200):
         """Add list nodes to tree (with lazy loading for large arrays)."""
-        # Increase max_items to 200 for better initial display
-        # Process in smaller chunks for ultra-fast response
-        chunk_size = 50
         items_to_show = min(len(data), max_items)
+        window = data[:items_to_show]
 
-        for i in range(0, items_to_show, chunk_size):
-            chunk_end = min(i + chunk_size, items_to_show)
-            for idx in range(i, chunk_end):
-                self._add_node(parent_id, f"[{idx}]", data[idx])
-            # Reduced update frequency for speed
-            if i + chunk_size < items_to_show and i % (chunk_size * 2) == 0:
-                self.root.update_idletasks()
+        # Scalar-only windows (number/string arrays, the common bulk
+        # case) take a dispatch-free loop; mixed windows go through the
+        # general batch inserter
+        if not any(type(v) is dict or type(v) is list for v in window):
+            self._add_scalar_list_nodes(parent_id, window)
+        else:
+            # One uninterrupted batch, as in _add_dict_nodes
+            self._add_nodes_batch(
+                parent_id, ((idx, data[idx]) for idx in range(items_to_show)))
 
-        # If there are more items, show all remaining items (no pagination needed for most cases)
+        # Defer the rest behind a pagination placeholder: inserting tens
+        # of thousands of rows nobody has scrolled to is pure Tcl overhead
         if len(data) > max_items:
-            for idx in range(max_items, len(data)):
-                self._add_node(parent_id, f"[{idx}]", data[idx])
+            self._add_more_placeholder(parent_id, 'list', data, max_items)
+
+    def _add_scalar_list_nodes(self, parent_id: str, window: list, start: int = 0):
+        """Insert a run of scalar list elements with no container dispatch.
+
+        Every row is a leaf, so the per-item isinstance checks and the
+        placeholder branches of _add_nodes_batch are dead weight here.
+        """
+        insert = self.tree.insert
+        iid_value = self._iid_value
+        iid_tags = self._iid_tags
+        iid_path = self._iid_path
+        parent_path = iid_path.get(parent_id, ())
+        for idx, value in enumerate(window, start):
+            node_id = insert(parent_id, 'end',
+                             text=f'[{idx}]: {_leaf_display(value)}',
+                             tags=('value',))
+            iid_tags[node_id] = ('value',)
+            iid_value[node_id] = value
+            iid_path[node_id] = parent_path + (idx,)
+
+    def _add_more_placeholder(self, parent_id: str, kind: str, data, offset: int):
+        """Insert a '... Show N more' placeholder for deferred children."""
+        remaining = len(data) - offset
+        more_id = self.tree.insert(
+            parent_id, 'end',
+            text=f'... Show {remaining} more item{"s" if remaining != 1 else ""}',
+            tags=('more',))
+        self._iid_tags[more_id] = ('more',)
+        self._more_items[more_id] = (parent_id, kind, data, offset)
+
+    def _show_more(self, item_id: str):
+        """Materialize the children hidden behind a 'Show more' placeholder."""
+        parent_id, kind, data, offset = self._more_items.pop(item_id)
+        self.tree.delete(item_id)
+        if kind == 'dict':
+            pairs = data[offset:]
+        else:
+            rest = data[offset:]
+            if not any(type(v) is dict or type(v) is list for v in rest):
+                self._add_scalar_list_nodes(parent_id, rest, offset)
+                return
+            pairs = ((idx, data[idx]) for idx in range(offset, len(data)))
+        self._add_nodes_batch(parent_id, pairs)
 
     def _add_node(self, parent_id: str, key: str, value: Any):
         """Add a single node to the tree."""
-        if isinstance(value, dict):
-            count = len(value)
-            node_id = self.tree.insert(parent_id, 'end', text=f'{key} {{{count}}}', tags=('object',))
-            if count > 0:
-                # Add placeholder for lazy loading
-                self.tree.insert(node_id, 'end', text='Loading...', tags=('lazy',))
-        elif isinstance(value, list):
-            count = len(value)
-            node_id = self.tree.insert(parent_id, 'end', text=f'{key} [{count}]', tags=('array',))
-            if count > 0:
-                # Add placeholder for lazy loading
-                self.tree.insert(node_id, 'end', text='Loading...', tags=('lazy',))
-        else:
-            # Leaf node
-            value_str = str(value)
-            if len(value_str) > 100:
-                value_str = value_str[:100] + "..."
-            self.tree.insert(parent_id, 'end', text=f'{key}: {value_str}', tags=('value',))
+        self._add_nodes_batch(parent_id, ((key, value),))
+
+    def _add_nodes_batch(self, parent_id: str, pairs):
+        """Insert (key, value) pairs under parent in one tight loop.
+
+        Bulk population pays one Python frame per batch instead of one
+        per node, with the hot callables and dicts bound as locals.
+        Containers get the usual Loading... placeholder instead of their
+        children, so nothing below this level is materialized.
+        """
+        insert = self.tree.insert
+        iid_value = self._iid_value
+        iid_tags = self._iid_tags
+        iid_path = self._iid_path
+        parent_path = iid_path.get(parent_id, ())
+        for key, value in pairs:
+            # Raw int list indices are kept in the path sidecar; only the
+            # display text gets the [n] decoration. Dict keys are interned:
+            # arrays of homogeneous objects repeat the same few keys for
+            # every element, so the path tuples all share one string object
+            if type(key) is int:
+                display_key = f'[{key}]'
+            else:
+                key = sys.intern(key)
+                display_key = key
+            if isinstance(value, dict):
+                node_id = insert(parent_id, 'end', text=f'{display_key} {{{len(value)}}}', tags=('object',))
+                iid_tags[node_id] = ('object',)
+                if value:
+                    # Add placeholder for lazy loading
+                    insert(node_id, 'end', text='Loading...', tags=('lazy',))
+            elif isinstance(value, list):
+                node_id = insert(parent_id, 'end', text=f'{display_key} [{len(value)}]', tags=('array',))
+                iid_tags[node_id] = ('array',)
+                if value:
+                    # Add placeholder for lazy loading
+                    insert(node_id, 'end', text='Loading...', tags=('lazy',))
+            else:
+                node_id = insert(parent_id, 'end', text=f'{display_key}: {_leaf_display(value)}', tags=('value',))
+                iid_tags[node_id] = ('value',)
+            iid_value[node_id] = value
+            iid_path[node_id] = parent_path + (key,)
 
     def on_tree_expand(self, event):
         """Handle lazy loading when a node is expanded."""
@@ -1074,6 +1621,10 @@ class JSONEditorGUI:
 
     def _get_value_for_item(self, item_id: str) -> Any:
         """Get the JSON value for a tree item by traversing the path."""
+        # Fast path: subtree reference recorded when the item was inserted
+        if item_id in self._iid_value:
+            return self._iid_value[item_id]
+
         path = []
         current = item_id
 
@@ -1092,10 +1643,14 @@ class JSONEditorGUI:
                 else:
                     key = text
 
-                path.insert(0, key)
+                path.append(key)
 
             current = parent
 
+        # Walked leaf-to-root, so flip into root-to-leaf order; append +
+        # reverse is O(depth) where insert(0, ...) was O(depth^2)
+        path.reverse()
+
         # Traverse JSON data using path
         value = self.json_data
         for key in path:
@@ -1110,6 +1665,10 @@ class JSONEditorGUI:
             if value is None:
                 break
 
+        # Backfill the sidecar so repeated lookups of this item (select
+        # handler, context menu, save-node) skip the walk next time; it
+        # is cleared with the other sidecars whenever the tree rebuilds
+        self._iid_value[item_id] = value
         return value
 
     def on_tree_select(self, event):
@@ -1130,17 +1689,66 @@ class JSONEditorGUI:
         self.value_text.delete('1.0', tk.END)
         if value is not None:
             if isinstance(value, (dict, list)):
-                # Pretty print complex objects
-                formatted = json.dumps(value, indent=2, ensure_ascii=False)
-                self.value_text.insert('1.0', formatted)
+                if len(value) > 1000:
+                    # Pretty-printing a huge subtree can block for
+                    # seconds; render it on the worker thread and fill
+                    # the editor when it lands (if still selected)
+                    self.value_text.insert('1.0', 'Rendering large value...')
+                    future = self._search_executor().submit(_dumps_pretty, value)
+
+                    def on_rendered(f, item_id=item_id):
+                        # Runs on the worker; check for failure so the
+                        # editor never sticks on the rendering notice
+                        error = f.exception()
+                        if error is not None:
+                            self.root.after(0, self._report_render_error,
+                                            item_id, error)
+                        else:
+                            self.root.after(0, self._show_rendered_value,
+                                            item_id, f.result())
+
+                    future.add_done_callback(on_rendered)
+                else:
+                    # Pretty print complex objects
+                    formatted = _dumps_pretty(value)
+                    self.value_text.insert('1.0', formatted)
             else:
                 self.value_text.insert('1.0', str(value))
 
         # Reset modified flag
         self.value_text.edit_modified(False)
 
+    def _show_rendered_value(self, item_id: str, formatted: str):
+        """Place a worker-rendered value into the editor, if still relevant."""
+        selected = self.tree.selection()
+        if not selected or selected[0] != item_id:
+            # User moved on while the render was in flight
+            return
+        if len(formatted) > 1024 * 1024:
+            self._insert_large_text(formatted)
+        else:
+            self.value_text.delete('1.0', tk.END)
+            self.value_text.insert('1.0', formatted)
+            self.value_text.edit_modified(False)
+
+    def _report_render_error(self, item_id: str, error: BaseException):
+        """Report a worker-side render failure, if still relevant."""
+        selected = self.tree.selection()
+        if not selected or selected[0] != item_id:
+            # User moved on while the render was in flight
+            return
+        self.value_text.delete('1.0', tk.END)
+        self.value_text.insert('1.0', f'Failed to render value: {error}')
+        self.value_text.edit_modified(False)
+
     def _get_path_for_item(self, item_id: str) -> List[str]:
         """Get the path to a tree item."""
+        # Fast path: raw path recorded at insert time (also immune to keys
+        # that contain ': ', ' {' or ' [' substrings)
+        raw = self._iid_path.get(item_id)
+        if raw is not None:
+            return [f'[{k}]' if type(k) is int else k for k in raw]
+
         path = []
         current = item_id
 
@@ -1158,10 +1766,12 @@ class JSONEditorGUI:
                 else:
                     key = text
 
-                path.insert(0, key)
+                path.append(key)
 
             current = parent
 
+        # Walked leaf-to-root, so flip into root-to-leaf order
+        path.reverse()
         return path
 
     def on_value_modified(self, event):
@@ -1195,35 +1805,27 @@ class JSONEditorGUI:
         # Clear existing content first
         self.value_text.delete('1.0', tk.END)
 
-        # Disable the widget during insert to prevent UI updates
-        self.value_text.config(state='disabled')
         self.edit_status_label.config(text="Pasting large content...", foreground="blue")
-        self.root.update()
 
-        # Insert text in chunks
-        chunk_size = 50000  # 50KB chunks
+        # 1MB chunks: Text.insert handles large strings in C, so the only
+        # reason to chunk at all is to let the event loop breathe between
+        # inserts. No state-toggling round-trips per chunk either.
+        chunk_size = 1024 * 1024
         total_chunks = (len(text) + chunk_size - 1) // chunk_size
+        show_progress = total_chunks > 10
 
         def insert_chunk(index=0):
             if index < total_chunks:
                 start = index * chunk_size
-                end = min((index + 1) * chunk_size, len(text))
-                chunk = text[start:end]
+                self.value_text.insert(tk.END, text[start:start + chunk_size])
 
-                # Temporarily enable to insert
-                self.value_text.config(state='normal')
-                self.value_text.insert(tk.END, chunk)
-                self.value_text.config(state='disabled')
+                if show_progress:
+                    progress = int((index + 1) / total_chunks * 100)
+                    self.edit_status_label.config(text=f"Pasting... {progress}%", foreground="blue")
 
-                # Update progress
-                progress = int((index + 1) / total_chunks * 100)
-                self.edit_status_label.config(text=f"Pasting... {progress}%", foreground="blue")
-
-                # Schedule next chunk
-                self.root.after(1, lambda: insert_chunk(index + 1))
+                # Yield to the event loop without forcing a timer wait
+                self.root.after_idle(insert_chunk, index + 1)
             else:
-                # Done - re-enable widget
-                self.value_text.config(state='normal')
                 self.value_text.mark_set(tk.INSERT, '1.0')  # Move cursor to start
                 self.value_text.see('1.0')  # Scroll to top
                 self.edit_status_label.config(text="Paste complete", foreground="green")
@@ -1242,20 +1844,41 @@ class JSONEditorGUI:
             return
 
         item_id = selected[0]
-        path = self._get_path_for_item(item_id)
+        # Prefer the raw path (ints for list indices): plain subscripting in
+        # _set_value_at_path, no '[n]' string parsing per hop
+        path = self._iid_path.get(item_id)
+        if path is None:
+            path = self._get_path_for_item(item_id)
         new_value_str = self.value_text.get('1.0', tk.END).strip()
 
         try:
-            # Try to parse as JSON first
-            try:
-                new_value = json.loads(new_value_str)
-            except json.JSONDecodeError:
-                # If not valid JSON, treat as string
+            # No JSON value starts outside this set, so the common
+            # plain-string edit skips the parse and its exception cost
+            if not new_value_str or new_value_str[0] not in '{["-0123456789tfn':
                 new_value = new_value_str
+            else:
+                # Try to parse as JSON first
+                try:
+                    if orjson is not None:
+                        new_value = orjson.loads(new_value_str)
+                    else:
+                        new_value, end = _VALUE_DECODER.raw_decode(new_value_str)
+                        if new_value_str[end:].lstrip():
+                            # A valid value followed by trailing text is not
+                            # JSON; keep the edit as a plain string
+                            new_value = new_value_str
+                except json.JSONDecodeError:
+                    # If not valid JSON, treat as string
+                    new_value = new_value_str
 
             # Update the JSON data
             self._set_value_at_path(path, new_value)
 
+            if not self.modified:
+                # The cached parse is this very object, mutated in place;
+                # drop it so a reopen-to-discard really rereads the disk copy
+                for key in [k for k in self._parse_cache if k[0] == self.current_file]:
+                    del self._parse_cache[key]
             self.modified = True
             self.edit_status_label.config(text="Saved", foreground="green")
             self.status_label.config(text=f"Modified: {os.path.basename(self.current_file)} *")
@@ -1266,54 +1889,82 @@ class JSONEditorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to apply changes:\n{str(e)}")
 
-    def _set_value_at_path(self, path: List[str], value: Any):
-        """Set a value in the JSON data at the given path."""
+    def _set_value_at_path(self, path, value: Any):
+        """Set a value in the JSON data at the given path.
+
+        Accepts raw paths (int list indices, as recorded in _iid_path) as
+        plain subscripts; display-style '[n]' strings are still parsed for
+        paths recovered from tree text.
+        """
         if not path:
             return
 
         current = self.json_data
         for key in path[:-1]:
-            if isinstance(current, dict):
+            if type(key) is int:
+                current = current[key]
+            elif isinstance(current, dict):
                 current = current[key]
             elif isinstance(current, list):
                 if key.startswith('[') and key.endswith(']'):
-                    index = int(key[1:-1])
-                    current = current[index]
+                    current = current[int(key[1:-1])]
 
         # Set the final value
         final_key = path[-1]
-        if isinstance(current, dict):
+        if type(final_key) is int:
+            current[final_key] = value
+        elif isinstance(current, dict):
             current[final_key] = value
         elif isinstance(current, list):
             if final_key.startswith('[') and final_key.endswith(']'):
-                index = int(final_key[1:-1])
-                current[index] = value
+                current[int(final_key[1:-1])] = value
 
     def _refresh_tree_node(self, item_id: str, value: Any):
         """Refresh a tree node with new value."""
-        text = self.tree.item(item_id, 'text')
+        if item_id in self._iid_value:
+            self._iid_value[item_id] = value
+
+        # Recover the key from the path sidecar instead of re-splitting the
+        # display text, which breaks on keys containing ': ', ' {' or ' ['
+        raw = self._iid_path.get(item_id)
+        if raw:
+            last = raw[-1]
+            key = f'[{last}]' if type(last) is int else last
+        else:
+            text = self.tree.item(item_id, 'text')
+            if isinstance(value, dict):
+                key = text.split(' {')[0] if ' {' in text else text
+            elif isinstance(value, list):
+                key = text.split(' [')[0] if ' [' in text else text
+            elif ': ' in text:
+                key = text.split(': ')[0]
+            else:
+                return
 
         if isinstance(value, dict):
-            key = text.split(' {')[0] if ' {' in text else text
             self.tree.item(item_id, text=f'{key} {{{len(value)}}}')
         elif isinstance(value, list):
-            key = text.split(' [')[0] if ' [' in text else text
             self.tree.item(item_id, text=f'{key} [{len(value)}]')
         else:
-            if ': ' in text:
-                key = text.split(': ')[0]
+            if isinstance(value, str):
+                value_str = value[:100] + "..." if len(value) > 100 else value
+            else:
                 value_str = str(value)
                 if len(value_str) > 100:
                     value_str = value_str[:100] + "..."
-                self.tree.item(item_id, text=f'{key}: {value_str}')
+            self.tree.item(item_id, text=f'{key}: {value_str}')
 
     def revert_changes(self):
         """Revert changes in the value editor."""
         self.on_tree_select(None)
         self.edit_status_label.config(text="Reverted", foreground="blue")
 
-    def save_file(self):
-        """Save changes to the current file."""
+    def save_file(self, blocking: bool = False):
+        """Save changes to the current file.
+
+        With blocking=True the write happens inline; the close path uses
+        this so teardown cannot race the writer.
+        """
         if not self.current_file:
             self.save_file_as()
             return
@@ -1328,16 +1979,48 @@ class JSONEditorGUI:
             if not response:
                 return
 
-        try:
-            with open(self.current_file, 'w', encoding='utf-8') as f:
-                json.dump(self.json_data, f, indent=2, ensure_ascii=False)
+        file_path = self.current_file
+        # Snapshot the document reference on the Tk thread: close_file
+        # clears self.json_data right after scheduling the save
+        data = self.json_data
+        self.status_label.config(text=f"Saving: {os.path.basename(file_path)}...")
 
-            self.modified = False
-            self.status_label.config(text=f"Saved: {os.path.basename(self.current_file)}")
-            self.edit_status_label.config(text="File saved!", foreground="green")
-            self.root.after(2000, lambda: self.edit_status_label.config(text=""))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
+        if blocking:
+            try:
+                _write_json_file(file_path, data)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
+                self.status_label.config(text="Error: Save failed")
+                return
+            self._on_save_complete(file_path)
+            return
+
+        # Serialize and write off the Tk thread so multi-hundred-MB saves
+        # do not freeze the UI; results are marshalled back via after().
+        # Non-daemon: interpreter exit waits for the write to finish.
+        def save_thread():
+            try:
+                _write_json_file(file_path, data)
+            except Exception as e:
+                self.root.after(0, lambda msg=str(e): messagebox.showerror(
+                    "Error", f"Failed to save file:\n{msg}"))
+                self.root.after(0, lambda: self.status_label.config(text="Error: Save failed"))
+                return
+            self.root.after(0, self._on_save_complete, file_path)
+
+        threading.Thread(target=save_thread).start()
+
+    def _on_save_complete(self, file_path: str):
+        """Finish a background save on the main thread."""
+        if self.loader is not None:
+            # File contents changed on disk; cached parses are stale
+            self.loader.clear_cache()
+        for key in [k for k in self._parse_cache if k[0] == file_path]:
+            del self._parse_cache[key]
+        self.modified = False
+        self.status_label.config(text=f"Saved: {os.path.basename(file_path)}")
+        self.edit_status_label.config(text="File saved!", foreground="green")
+        self.root.after(2000, lambda: self.edit_status_label.config(text=""))
 
     def save_file_as(self):
         """Save changes to a new file."""
@@ -1355,8 +2038,7 @@ class JSONEditorGUI:
             return
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.json_data, f, indent=2, ensure_ascii=False)
+            _write_json_file(file_path, self.json_data)
 
             self.current_file = file_path
             self.modified = False
@@ -1365,6 +2047,12 @@ class JSONEditorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
 
+    def _set_loader(self, loader):
+        """Swap in a new loader, closing the old one's descriptor."""
+        if self.loader is not None:
+            self.loader.close()
+        self.loader = loader
+
     def close_file(self):
         """Close the current file."""
         if self.modified:
@@ -1375,16 +2063,25 @@ class JSONEditorGUI:
             if response is None:  # Cancel
                 return
             elif response:  # Yes
-                self.save_file()
+                # Block: teardown below must not race the write
+                self.save_file(blocking=True)
 
         self.current_file = None
         self.json_data = None
+        if self.loader is not None:
+            self.loader.close()
         self.loader = None
         self.modified = False
+        self._iid_value.clear()
+        self._iid_tags.clear()
+        self._more_items.clear()
+        self._iid_path.clear()
 
         # Clear UI
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._cancel_expand_job()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
         self.value_text.delete('1.0', tk.END)
         self.path_label.config(text='')
         self.status_label.config(text='No file loaded')
@@ -1397,7 +2094,17 @@ class JSONEditorGUI:
         self.search_entry.select_range(0, tk.END)
 
     def _on_search_change(self, event):
-        """Handle search text changes - clear search if empty."""
+        """Handle search text changes, debounced to the end of typing."""
+        # Rebuilding the tree on every keystroke is wasteful and stutters;
+        # coalesce a fast burst of keys into one callback after 200 ms of
+        # quiet.
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(200, self._handle_search_change)
+
+    def _handle_search_change(self):
+        """Run the debounced reaction to search-box edits."""
+        self._search_job = None
         if not self.search_var.get().strip() and self.search_active:
             self.clear_search()
 
@@ -1415,21 +2122,61 @@ class JSONEditorGUI:
 
         use_regex = self.regex_var.get()
 
-        # Validate regex if enabled
+        # Validate regex if enabled (the compiled pattern is cached, so
+        # the matcher below reuses this same object)
         if use_regex:
             try:
-                re.compile(search_term)
+                _compile_search_pattern(search_term)
             except re.error as e:
                 messagebox.showerror("Invalid Regex", f"Invalid regular expression:\n{str(e)}")
                 return
 
-        # Show searching status
+        # Show searching status; the walk runs on a worker thread, so the
+        # mainloop repaints this on its own without a forced update()
         self.status_label.config(text=f"Searching for '{search_term}'...")
-        self.root.update()
 
-        # Search through all JSON data
-        matching_paths = self._deep_search_json(self.json_data, search_term, use_regex)
+        # Build the matcher once up front: the regex is compiled a single
+        # time (instead of once per node) and the literal needle is
+        # casefolded a single time, so the per-node check is just a C-level
+        # search call.
+        if use_regex:
+            # The bound search method is the predicate itself: every node
+            # check is one C call, with no Python wrapper frame (a Match
+            # object is truthy, None is falsy)
+            matches_search = _compile_search_pattern(search_term).search
+        else:
+            # Needle casefolded exactly once, outside the walk; the
+            # per-node test is the C-level substring operator
+            needle = search_term.casefold()
+
+            def matches_search(text: str) -> bool:
+                return needle in text.casefold()
+
+        # Walk the document off the Tk thread; the single tree rebuild is
+        # marshalled back via after() when the matches are in
+        future = self._search_executor().submit(
+            self._deep_search_json, self.json_data, matches_search)
+
+        def on_done(f, term=search_term):
+            # Runs on the worker; surface failures instead of letting
+            # them die in the executor with the status bar stuck
+            error = f.exception()
+            if error is not None:
+                self.root.after(0, self._report_search_error, term, error)
+            else:
+                self.root.after(0, self._apply_search_results, term, f.result())
 
+        future.add_done_callback(on_done)
+
+    def _report_search_error(self, search_term: str, error: BaseException):
+        """Report a worker-side search failure, on the main thread."""
+        self.status_label.config(text="Search failed")
+        messagebox.showerror(
+            "Search Error",
+            f"Search for '{search_term}' failed:\n{error}")
+
+    def _apply_search_results(self, search_term: str, matching_paths: List[Tuple[List[str], Any, Optional[str]]]):
+        """Rebuild the tree from deep-search matches, on the main thread."""
         if not matching_paths:
             self.status_label.config(text=f"No matches found for '{search_term}'")
             messagebox.showinfo("No Results", f"No matches found for '{search_term}'")
@@ -1442,127 +2189,158 @@ class JSONEditorGUI:
         self.search_results_count = len(matching_paths)
         self.status_label.config(text=f"Found {len(matching_paths)} match{'es' if len(matching_paths) != 1 else ''} for '{search_term}'")
 
-    def _deep_search_json(self, data: Any, search_term: str, use_regex: bool, current_path: List[str] = None) -> List[Tuple[List[str], Any]]:
-        """Recursively search through JSON data for matches in keys and values."""
-        if current_path is None:
-            current_path = []
+    def _deep_search_json(self, data: Any, matches_search, current_path: List[str] = None) -> List[Tuple[List[str], Any, Optional[str]]]:
+        """Search through JSON data for matches in keys and values.
 
+        matches_search is the predicate prepared once by deep_search. The
+        walk is an explicit stack instead of recursion: no Python frame per
+        node, no recursion limit on deep documents, and the match check is
+        a single C-level call per node.
+        """
         matches = []
-
-        def matches_search(text: str) -> bool:
-            """Check if text matches search term."""
-            if use_regex:
-                try:
-                    return re.search(search_term, str(text), re.IGNORECASE) is not None
-                except re.error:
-                    return False
-            else:
-                return search_term.lower() in str(text).lower()
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                new_path = current_path + [key]
-
-                # Check if key matches
-                if matches_search(key):
-                    matches.append((new_path, value))
-
-                # Check if value matches (for leaf values)
-                if not isinstance(value, (dict, list)):
-                    if matches_search(str(value)):
-                        matches.append((new_path, value))
-
-                # Recursively search nested structures
-                if isinstance(value, (dict, list)):
-                    matches.extend(self._deep_search_json(value, search_term, use_regex, new_path))
-
-        elif isinstance(data, list):
-            for idx, value in enumerate(data):
-                new_path = current_path + [f"[{idx}]"]
-
-                # Check if value matches (for leaf values)
-                if not isinstance(value, (dict, list)):
-                    if matches_search(str(value)):
-                        matches.append((new_path, value))
-
-                # Recursively search nested structures
-                if isinstance(value, (dict, list)):
-                    matches.extend(self._deep_search_json(value, search_term, use_regex, new_path))
+        if type(data) is not dict and type(data) is not list:
+            return matches
+
+        append_match = matches.append
+        # Each frame is (dict_key_to_test, node, path_cons); list elements
+        # and the root carry None so only real keys are matched. Paths are
+        # (parent, segment) cons pairs: siblings share their prefix
+        # structurally, so extending a path is one 2-tuple instead of an
+        # O(depth) copy per node, and full paths are materialized only for
+        # actual matches.
+        root_cons = None
+        if current_path:
+            for seg in current_path:
+                root_cons = (root_cons, seg)
+        stack = deque()
+        stack.append((None, data, root_cons))
+        pop = stack.pop
+
+        while stack:
+            key, node, cons = pop()
+            node_type = type(node)
+            is_container = node_type is dict or node_type is list
+            key_hit = key is not None and matches_search(key)
+            if key_hit:
+                # Scalar display text is prepared here, on the search
+                # worker, so the filtered populate on the Tk thread just
+                # picks it up
+                append_match((_materialize_path(cons), node,
+                              None if is_container else _leaf_display(node)))
+
+            if node_type is dict:
+                # Push in reverse so pops come back in document order
+                stack.extend([(k, v, (cons, k)) for k, v in node.items()][::-1])
+            elif node_type is list:
+                stack.extend(
+                    [(None, v, (cons, f"[{i}]")) for i, v in enumerate(node)][::-1])
+            elif not key_hit:
+                # A matched key already recorded this path, so only unmatched
+                # leaves are scanned. Stringify by type: strings pass through
+                # untouched and JSON literals map to their document spelling,
+                # so searching 'null'/'true'/'false' finds them
+                if node_type is str:
+                    text = node
+                elif node is None:
+                    text = 'null'
+                elif node is True:
+                    text = 'true'
+                elif node is False:
+                    text = 'false'
+                else:
+                    text = str(node)
+                if matches_search(text):
+                    append_match((_materialize_path(cons), node, _leaf_display(node)))
 
         return matches
 
-    def _populate_filtered_tree(self, matching_paths: List[Tuple[List[str], Any]]):
+    def _populate_filtered_tree(self, matching_paths: List[Tuple[List[str], Any, Optional[str]]]):
         """Populate tree with only matching items and their parent paths."""
         # Clear existing tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._cancel_expand_job()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._iid_value.clear()
+        self._iid_tags.clear()
+        self._more_items.clear()
+        self._iid_path.clear()
 
         if not matching_paths:
             return
 
-        # Build a set of all paths that need to be shown (matches + their parents)
-        paths_to_show = set()
-        for path, value in matching_paths:
-            # Add the full path
-            paths_to_show.add(tuple(path))
-            # Add all parent paths
-            for i in range(len(path)):
-                paths_to_show.add(tuple(path[:i+1]))
+        # Unmap the widget while the filtered rows go in: thousands of
+        # inserts into a mapped Treeview each schedule incremental redraw
+        # work, while an unmapped one lays out once on re-pack
+        self.tree.pack_forget()
+        try:
+            self._build_filtered_tree(matching_paths)
+        finally:
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def _build_filtered_tree(self, matching_paths: List[Tuple[List[str], Any, Optional[str]]]):
+        """Insert the filtered rows (tree is unmapped by the caller)."""
+
+        # Build a prefix trie of the paths to show: one walk per match
+        # marks the path and every parent, instead of hashing a tuple
+        # slice per prefix, and descent checks during populate become
+        # plain dict lookups
+        path_trie = {}
+        leaf_display = {}
+        for path, value, display in matching_paths:
+            node = path_trie
+            for seg in path:
+                node = node.setdefault(seg, {})
+            if display is not None:
+                leaf_display[tuple(path)] = display
 
         # Create root node
-        if isinstance(self.json_data, dict):
-            root_id = self.tree.insert('', 'end', text=f'Root (filtered: {len(matching_paths)} matches)', open=True, tags=('search_result',))
-            self._add_filtered_dict_nodes(root_id, self.json_data, [], paths_to_show)
-        elif isinstance(self.json_data, list):
+        if isinstance(self.json_data, (dict, list)):
             root_id = self.tree.insert('', 'end', text=f'Root (filtered: {len(matching_paths)} matches)', open=True, tags=('search_result',))
-            self._add_filtered_list_nodes(root_id, self.json_data, [], paths_to_show)
-
-    def _add_filtered_dict_nodes(self, parent_id: str, data: dict, current_path: List[str], paths_to_show: set):
-        """Add only filtered dictionary nodes to tree."""
-        for key, value in data.items():
-            path = current_path + [key]
-            path_tuple = tuple(path)
+            self._add_filtered_nodes(root_id, self.json_data, path_trie, leaf_display)
+
+    def _add_filtered_nodes(self, parent_id: str, data, trie_node: dict,
+                            leaf_display: dict, path: tuple = ()):
+        """Add the children of data present in the paths-to-show trie.
+
+        One loop handles both dicts and lists; trie_node is this level of
+        the prefix trie, and a child is shown iff its key is present.
+        leaf_display holds display strings precomputed by the search walk,
+        keyed by path tuple.
+        """
+        tree_insert = self.tree.insert
+        is_dict = isinstance(data, dict)
+
+        # Iterate the trie, not the data: only paths that lead to a match
+        # are visited, so populate cost scales with the number of matches
+        # rather than the size of the document
+        for key, sub_trie in trie_node.items():
+            if is_dict:
+                if key not in data:
+                    continue
+                value = data[key]
+            else:
+                try:
+                    value = data[int(key[1:-1])]
+                except (ValueError, IndexError):
+                    continue
 
-            # Only add if this path should be shown
-            if path_tuple in paths_to_show:
-                if isinstance(value, dict):
-                    count = len(value)
-                    node_id = self.tree.insert(parent_id, 'end', text=f'{key} {{{count}}}', open=True, tags=('object', 'search_result'))
-                    self._add_filtered_dict_nodes(node_id, value, path, paths_to_show)
-                elif isinstance(value, list):
-                    count = len(value)
-                    node_id = self.tree.insert(parent_id, 'end', text=f'{key} [{count}]', open=True, tags=('array', 'search_result'))
-                    self._add_filtered_list_nodes(node_id, value, path, paths_to_show)
-                else:
-                    # Leaf node
-                    value_str = str(value)
-                    if len(value_str) > 100:
-                        value_str = value_str[:100] + "..."
-                    self.tree.insert(parent_id, 'end', text=f'{key}: {value_str}', tags=('value', 'search_result'))
-
-    def _add_filtered_list_nodes(self, parent_id: str, data: list, current_path: List[str], paths_to_show: set):
-        """Add only filtered list nodes to tree."""
-        for idx, value in enumerate(data):
-            index_key = f"[{idx}]"
-            path = current_path + [index_key]
-            path_tuple = tuple(path)
-
-            # Only add if this path should be shown
-            if path_tuple in paths_to_show:
-                if isinstance(value, dict):
-                    count = len(value)
-                    node_id = self.tree.insert(parent_id, 'end', text=f'{index_key} {{{count}}}', open=True, tags=('object', 'search_result'))
-                    self._add_filtered_dict_nodes(node_id, value, path, paths_to_show)
-                elif isinstance(value, list):
-                    count = len(value)
-                    node_id = self.tree.insert(parent_id, 'end', text=f'{index_key} [{count}]', open=True, tags=('array', 'search_result'))
-                    self._add_filtered_list_nodes(node_id, value, path, paths_to_show)
-                else:
-                    # Leaf node
-                    value_str = str(value)
-                    if len(value_str) > 100:
-                        value_str = value_str[:100] + "..."
-                    self.tree.insert(parent_id, 'end', text=f'{index_key}: {value_str}', tags=('value', 'search_result'))
+            child_path = path + (key,)
+            if isinstance(value, dict):
+                node_id = tree_insert(parent_id, 'end', text=f'{key} {{{len(value)}}}',
+                                      open=True, tags=('object', 'search_result'))
+                self._add_filtered_nodes(node_id, value, sub_trie, leaf_display, child_path)
+            elif isinstance(value, list):
+                node_id = tree_insert(parent_id, 'end', text=f'{key} [{len(value)}]',
+                                      open=True, tags=('array', 'search_result'))
+                self._add_filtered_nodes(node_id, value, sub_trie, leaf_display, child_path)
+            else:
+                # Leaf node: display text was precomputed on the search
+                # worker for matched leaves; fall back to formatting here
+                value_str = leaf_display.get(child_path)
+                if value_str is None:
+                    value_str = _leaf_display(value)
+                tree_insert(parent_id, 'end', text=f'{key}: {value_str}', tags=('value', 'search_result'))
 
     def clear_search(self):
         """Clear search and restore full tree."""
@@ -1663,16 +2441,22 @@ class JSONEditorGUI:
 
         # Size-based options
         size_frame = ttk.Frame(options_frame)
-        ttk.Label(size_frame, text="Max file size:").pack(side=tk.LEFT, padx=(0, 10))
+        size_row = ttk.Frame(size_frame)
+        size_row.pack(fill=tk.X)
+        ttk.Label(size_row, text="Max file size:").pack(side=tk.LEFT, padx=(0, 10))
         file_size_var = tk.StringVar(value="1")
-        file_size_spin = ttk.Spinbox(size_frame, from_=1, to=1000, textvariable=file_size_var, width=10)
+        file_size_spin = ttk.Spinbox(size_row, from_=1, to=1000, textvariable=file_size_var, width=10)
         file_size_spin.pack(side=tk.LEFT, padx=5)
 
         size_unit_var = tk.StringVar(value="MB")
-        size_unit_combo = ttk.Combobox(size_frame, textvariable=size_unit_var,
+        size_unit_combo = ttk.Combobox(size_row, textvariable=size_unit_var,
                                        values=["KB", "MB", "GB"], state="readonly", width=8)
         size_unit_combo.pack(side=tk.LEFT, padx=5)
 
+        pack_items_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(size_frame, text="Pack items to minimize file count (reorders items)",
+                        variable=pack_items_var).pack(anchor=tk.W, pady=(10, 0))
+
         # Function to update visible options based on method
         def update_options():
             # Hide both first
@@ -1722,7 +2506,8 @@ class JSONEditorGUI:
                 else:
                     size_value = float(file_size_var.get())
                     size_unit = size_unit_var.get()
-                    self._split_by_size(output_folder, size_value, size_unit, dialog)
+                    self._split_by_size(output_folder, size_value, size_unit, dialog,
+                                        pack_items=pack_items_var.get())
 
                 dialog.destroy()
             except Exception as e:
@@ -1733,241 +2518,293 @@ class JSONEditorGUI:
 
     def _split_by_count(self, output_folder: str, num_files: int):
         """Split JSON into specified number of files."""
+        # Collect the chunks first, then write them in parallel: each part
+        # is independent, and the encoder and write syscalls release the
+        # GIL, so the files land concurrently off the Tk thread
+        chunks = []
         if isinstance(self.json_data, list):
             items = self.json_data
             items_per_file = max(1, len(items) // num_files)
 
-            file_index = 0
-            for i in range(0, len(items), items_per_file):
-                if file_index >= num_files - 1 and i + items_per_file < len(items):
-                    # Last file gets remaining items
-                    chunk = items[i:]
-                else:
-                    chunk = items[i:i + items_per_file]
-
-                if chunk:  # Only create file if there's data
-                    output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(chunk, f, indent=2, ensure_ascii=False)
-                    file_index += 1
-
-                if file_index >= num_files:
+            # islice over one iterator: each chunk is materialized exactly
+            # once, with no repeated list slicing of the source
+            it = iter(items)
+            while True:
+                if len(chunks) == num_files - 1:
+                    rest = list(it)
+                    if rest:  # Last file gets remaining items
+                        chunks.append(rest)
+                    break
+                chunk = list(islice(it, items_per_file))
+                if not chunk:
                     break
+                chunks.append(chunk)
 
         elif isinstance(self.json_data, dict):
-            items = list(self.json_data.items())
-            items_per_file = max(1, len(items) // num_files)
+            items_per_file = max(1, len(self.json_data) // num_files)
+
+            # Iterate items() directly; no intermediate list of all pairs
+            it = iter(self.json_data.items())
+            while True:
+                if len(chunks) == num_files - 1:
+                    rest = dict(it)
+                    if rest:  # Last file gets remaining items
+                        chunks.append(rest)
+                    break
+                chunk_dict = dict(islice(it, items_per_file))
+                if not chunk_dict:
+                    break
+                chunks.append(chunk_dict)
 
-            file_index = 0
-            for i in range(0, len(items), items_per_file):
-                if file_index >= num_files - 1 and i + items_per_file < len(items):
-                    # Last file gets remaining items
-                    chunk_items = items[i:]
-                else:
-                    chunk_items = items[i:i + items_per_file]
+        pairs = [(os.path.join(output_folder, f"split_part_{index + 1}.json"), chunk)
+                 for index, chunk in enumerate(chunks)]
 
-                if chunk_items:  # Only create file if there's data
-                    chunk_dict = dict(chunk_items)
-                    output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(chunk_dict, f, indent=2, ensure_ascii=False)
-                    file_index += 1
+        def write_part(pair):
+            _write_json_file(pair[0], pair[1])
 
-                if file_index >= num_files:
-                    break
+        def split_thread():
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                    list(executor.map(write_part, pairs))
+            except Exception as e:
+                self.root.after(0, lambda msg=str(e): messagebox.showerror(
+                    "Split Error", f"Failed to split file:\n{msg}"))
+                return
+            self.root.after(0, self._on_split_complete, output_folder, len(pairs))
+
+        threading.Thread(target=split_thread, daemon=True).start()
 
+    def _on_split_complete(self, output_folder: str, file_count: int):
+        """Report a finished split on the main thread."""
         messagebox.showinfo("Split Complete",
-                           f"Successfully split into {file_index} files in:\n{output_folder}")
-        self.status_label.config(text=f"Split into {file_index} files")
+                           f"Successfully split into {file_count} files in:\n{output_folder}")
+        self.status_label.config(text=f"Split into {file_count} files")
+
+    def _ask_oversized_choice(self, title: str, message: str, skip_text: str,
+                              parent_dialog=None) -> str:
+        """Show the modal three-way dialog for an oversized split item.
+
+        Returns 'separate', 'deeper', 'skip', or '' if the dialog was
+        closed without choosing.  If the user ticked "apply to all" on an
+        earlier dialog in this split, that decision is returned without
+        prompting again.
+        """
+        if self._bulk_oversize_choice:
+            return self._bulk_oversize_choice
+
+        owner = parent_dialog if parent_dialog else self.root
+        dialog = tk.Toplevel(owner)
+        dialog.title(title)
+        height = 250 if title == "Oversized Key" else 230
+        dialog.geometry(f"450x{height}")
+        dialog.transient(owner)
+        dialog.grab_set()
+
+        # Center dialog
+        dialog.update_idletasks()
+        x = (self._screen_w // 2) - (225)
+        y = (self._screen_h // 2) - (height // 2)
+        dialog.geometry(f"450x{height}+{x}+{y}")
+
+        choice = tk.StringVar(value="")
+
+        def pick(value):
+            choice.set(value)
+            dialog.destroy()
+
+        ttk.Label(dialog, text=message, font=('Arial', 10, 'bold')).pack(pady=15)
+        ttk.Label(dialog, text="What would you like to do?").pack(pady=5)
+
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(pady=20)
+
+        ttk.Button(btn_frame, text="Create Separate File",
+                  command=partial(pick, "separate"),
+                  width=20).pack(pady=5)
+        ttk.Button(btn_frame, text="Split One Level Deeper",
+                  command=partial(pick, "deeper"),
+                  width=20).pack(pady=5)
+        ttk.Button(btn_frame, text=skip_text,
+                  command=partial(pick, "skip"),
+                  width=20).pack(pady=5)
+
+        apply_all = tk.BooleanVar(value=False)
+        ttk.Checkbutton(dialog, text="Apply to all remaining oversized items",
+                        variable=apply_all).pack(pady=5)
+
+        dialog.wait_window()
+        result = choice.get()
+        if result and apply_all.get():
+            self._bulk_oversize_choice = result
+        return result
+
+    def _split_by_size(self, output_folder: str, size_value: float, size_unit: str,
+                       parent_dialog=None, pack_items: bool = False):
+        """Split JSON by file size, automatically going one level deeper for oversized keys.
 
-    def _split_by_size(self, output_folder: str, size_value: float, size_unit: str, parent_dialog=None):
-        """Split JSON by file size, automatically going one level deeper for oversized keys."""
+        With pack_items, fitting items are bin-packed first-fit-decreasing
+        instead of cut in document order, which yields fewer output files
+        at the cost of reordering items across parts.
+        """
         # Convert size to bytes
         size_multipliers = {"KB": 1024, "MB": 1024 * 1024, "GB": 1024 * 1024 * 1024}
-        max_size_bytes = size_value * size_multipliers[size_unit]
+        # int so the hot per-item comparisons stay int-vs-int
+        max_size_bytes = int(size_value * size_multipliers[size_unit])
+
+        # Each split starts with a clean slate for "apply to all"
+        self._bulk_oversize_choice = None
+
+        # Join the folder once; every part path is prefix + number
+        part_prefix = os.path.join(output_folder, "split_part_")
 
         file_index = 0
         current_chunk = [] if isinstance(self.json_data, list) else {}
+        # Serialized form of each chunk entry, built once at measurement
+        # time and reused verbatim on write, so nothing is encoded twice
+        current_blobs = []
         current_size = 0
-
-        def get_item_size(item):
-            """Estimate size of JSON item in bytes."""
-            return len(json.dumps(item, ensure_ascii=False).encode('utf-8'))
+        # (blob, size) pairs held back for bin packing when pack_items
+        fitting = []
+
+        # Writes go through a small pool so encoding the next chunk
+        # overlaps the disk write of the previous one; payloads are
+        # immutable bytes, so handing them to a worker thread is safe.
+        io_pool = ThreadPoolExecutor(max_workers=4)
+        write_futures = []
+
+        def submit_write(file_path: str, payload: bytes):
+            write_futures.append(io_pool.submit(_write_bytes, file_path, payload))
+
+        def encode_item(item) -> bytes:
+            """Serialize an item once; its length is the measured size."""
+            return _encode_json_value(item)
+
+        # Blobs for objects owned by the loaded document, keyed by id().
+        # Safe because the document keeps them alive for the whole split
+        # (ids cannot be recycled); temporaries like the {key: value}
+        # wrappers must NOT go through this, they die between calls.
+        blob_cache = {}
+
+        def encode_owned(item) -> bytes:
+            """encode_item memoized for objects the document keeps alive."""
+            blob = blob_cache.get(id(item))
+            if blob is None:
+                blob = _encode_json_value(item)
+                blob_cache[id(item)] = blob
+            return blob
 
         def save_chunk():
-            """Save current chunk to file."""
-            nonlocal file_index, current_chunk, current_size
-            if (isinstance(current_chunk, list) and len(current_chunk) > 0) or \
-               (isinstance(current_chunk, dict) and len(current_chunk) > 0):
-                output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(current_chunk, f, indent=2, ensure_ascii=False)
+            """Save current chunk to file from its pre-encoded blobs."""
+            nonlocal file_index, current_size
+            if current_blobs:
+                output_file = f"{part_prefix}{file_index + 1}.json"
+                if isinstance(current_chunk, list):
+                    payload = _assemble_json_array(current_blobs)
+                else:
+                    payload = _assemble_json_object(current_blobs)
+                submit_write(output_file, payload)
                 file_index += 1
-                current_chunk = [] if isinstance(self.json_data, list) else {}
+                # Clear in place so bound append/__setitem__ stay valid
+                current_chunk.clear()
+                current_blobs.clear()
                 current_size = 0
 
+        def write_nested_chunk(parent_key: str, payload: bytes):
+            """Write a nested chunk wrapped under its parent key."""
+            nonlocal file_index
+            output_file = f"{part_prefix}{file_index + 1}.json"
+            key_blob = _encode_json_value(parent_key)
+            submit_write(output_file, b'{\n' + key_blob + b': ' + payload + b'\n}')
+            file_index += 1
+
         def split_nested_dict(parent_key: str, nested_dict: dict):
             """Split a nested dictionary one level deeper."""
-            nonlocal file_index
-            nested_chunk = {}
+            nested_blobs = []
             nested_size = 0
 
             for nested_key, nested_value in nested_dict.items():
-                nested_item_size = get_item_size({nested_key: nested_value})
+                blob = encode_item({nested_key: nested_value})
+                nested_item_size = len(blob)
 
                 # If adding this would exceed limit and we have content, save current nested chunk
-                if nested_size + nested_item_size > max_size_bytes and len(nested_chunk) > 0:
-                    output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump({parent_key: nested_chunk}, f, indent=2, ensure_ascii=False)
-                    file_index += 1
-                    nested_chunk = {}
+                if nested_size + nested_item_size > max_size_bytes and nested_blobs:
+                    write_nested_chunk(parent_key, _assemble_json_object(nested_blobs))
+                    nested_blobs = []
                     nested_size = 0
 
-                nested_chunk[nested_key] = nested_value
+                nested_blobs.append(blob)
                 nested_size += nested_item_size
 
             # Save final nested chunk
-            if len(nested_chunk) > 0:
-                output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump({parent_key: nested_chunk}, f, indent=2, ensure_ascii=False)
-                file_index += 1
+            if nested_blobs:
+                write_nested_chunk(parent_key, _assemble_json_object(nested_blobs))
 
         def split_nested_list(parent_key: str, nested_list: list):
             """Split a nested list one level deeper."""
-            nonlocal file_index
-            nested_chunk = []
+            nested_blobs = []
             nested_size = 0
 
             for nested_item in nested_list:
-                nested_item_size = get_item_size(nested_item)
+                blob = encode_owned(nested_item)
+                nested_item_size = len(blob)
 
                 # If adding this would exceed limit and we have content, save current nested chunk
-                if nested_size + nested_item_size > max_size_bytes and len(nested_chunk) > 0:
-                    output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump({parent_key: nested_chunk}, f, indent=2, ensure_ascii=False)
-                    file_index += 1
-                    nested_chunk = []
+                if nested_size + nested_item_size > max_size_bytes and nested_blobs:
+                    write_nested_chunk(parent_key, _assemble_json_array(nested_blobs))
+                    nested_blobs = []
                     nested_size = 0
 
-                nested_chunk.append(nested_item)
+                nested_blobs.append(blob)
                 nested_size += nested_item_size
 
             # Save final nested chunk
-            if len(nested_chunk) > 0:
-                output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump({parent_key: nested_chunk}, f, indent=2, ensure_ascii=False)
-                file_index += 1
+            if nested_blobs:
+                write_nested_chunk(parent_key, _assemble_json_array(nested_blobs))
 
         if isinstance(self.json_data, list):
+            chunk_append = current_chunk.append
+            blobs_append = current_blobs.append
             for idx, item in enumerate(self.json_data):
-                item_size = get_item_size(item)
-                item_size_mb = item_size / (1024 * 1024)
+                item_blob = encode_owned(item)
+                item_size = len(item_blob)
 
                 # Check if single item exceeds max size
                 if item_size > max_size_bytes:
+                    # Only format the size for the dialog paths
+                    item_size_mb = item_size / (1024 * 1024)
                     # If it's a dict or list, offer choice to go deeper
                     if isinstance(item, dict) and len(item) > 0:
-                        # Create custom dialog with three options
-                        choice_dialog = tk.Toplevel(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.title("Oversized Item")
-                        choice_dialog.geometry("450x200")
-                        choice_dialog.transient(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.grab_set()
-
-                        # Center dialog
-                        choice_dialog.update_idletasks()
-                        x = (choice_dialog.winfo_screenwidth() // 2) - (225)
-                        y = (choice_dialog.winfo_screenheight() // 2) - (100)
-                        choice_dialog.geometry(f"450x200+{x}+{y}")
-
-                        choice = tk.StringVar(value="")
-
-                        ttk.Label(choice_dialog,
-                                 text=f"Item at index [{idx}] is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
-                                 font=('Arial', 10, 'bold')).pack(pady=15)
-
-                        ttk.Label(choice_dialog, text="What would you like to do?").pack(pady=5)
-
-                        btn_frame = ttk.Frame(choice_dialog)
-                        btn_frame.pack(pady=20)
-
-                        ttk.Button(btn_frame, text="Create Separate File",
-                                  command=lambda: [choice.set("separate"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Split One Level Deeper",
-                                  command=lambda: [choice.set("deeper"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Skip This Item",
-                                  command=lambda: [choice.set("skip"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-
-                        choice_dialog.wait_window()
-
-                        if choice.get() == "separate":
-                            if len(current_chunk) > 0:
+                        choice = self._ask_oversized_choice(
+                            "Oversized Item",
+                            f"Item at index [{idx}] is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
+                            "Skip This Item", parent_dialog)
+
+                        if choice == "separate":
+                            if current_chunk:
                                 save_chunk()
-                            oversized_chunk = [item]
-                            output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(oversized_chunk, f, indent=2, ensure_ascii=False)
+                            output_file = f"{part_prefix}{file_index + 1}.json"
+                            submit_write(output_file, _assemble_json_array((item_blob,)))
                             file_index += 1
-                        elif choice.get() == "deeper":
-                            if len(current_chunk) > 0:
+                        elif choice == "deeper":
+                            if current_chunk:
                                 save_chunk()
                             split_nested_dict(f"[{idx}]", item)
                         # else: skip
                         continue
                     elif isinstance(item, list) and len(item) > 0:
-                        # Create custom dialog with three options
-                        choice_dialog = tk.Toplevel(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.title("Oversized Item")
-                        choice_dialog.geometry("450x200")
-                        choice_dialog.transient(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.grab_set()
-
-                        # Center dialog
-                        choice_dialog.update_idletasks()
-                        x = (choice_dialog.winfo_screenwidth() // 2) - (225)
-                        y = (choice_dialog.winfo_screenheight() // 2) - (100)
-                        choice_dialog.geometry(f"450x200+{x}+{y}")
-
-                        choice = tk.StringVar(value="")
-
-                        ttk.Label(choice_dialog,
-                                 text=f"Item at index [{idx}] is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
-                                 font=('Arial', 10, 'bold')).pack(pady=15)
-
-                        ttk.Label(choice_dialog, text="What would you like to do?").pack(pady=5)
-
-                        btn_frame = ttk.Frame(choice_dialog)
-                        btn_frame.pack(pady=20)
-
-                        ttk.Button(btn_frame, text="Create Separate File",
-                                  command=lambda: [choice.set("separate"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Split One Level Deeper",
-                                  command=lambda: [choice.set("deeper"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Skip This Item",
-                                  command=lambda: [choice.set("skip"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-
-                        choice_dialog.wait_window()
-
-                        if choice.get() == "separate":
-                            if len(current_chunk) > 0:
+                        choice = self._ask_oversized_choice(
+                            "Oversized Item",
+                            f"Item at index [{idx}] is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
+                            "Skip This Item", parent_dialog)
+
+                        if choice == "separate":
+                            if current_chunk:
                                 save_chunk()
-                            oversized_chunk = [item]
-                            output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(oversized_chunk, f, indent=2, ensure_ascii=False)
+                            output_file = f"{part_prefix}{file_index + 1}.json"
+                            submit_write(output_file, _assemble_json_array((item_blob,)))
                             file_index += 1
-                        elif choice.get() == "deeper":
-                            if len(current_chunk) > 0:
+                        elif choice == "deeper":
+                            if current_chunk:
                                 save_chunk()
                             split_nested_list(f"[{idx}]", item)
                         # else: skip
@@ -1983,132 +2820,73 @@ class JSONEditorGUI:
                         )
 
                         if response:
-                            if len(current_chunk) > 0:
+                            if current_chunk:
                                 save_chunk()
-                            oversized_chunk = [item]
-                            output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(oversized_chunk, f, indent=2, ensure_ascii=False)
+                            output_file = f"{part_prefix}{file_index + 1}.json"
+                            submit_write(output_file, _assemble_json_array((item_blob,)))
                             file_index += 1
                         continue
 
+                if pack_items:
+                    fitting.append((item_blob, item_size))
+                    continue
+
                 # Check if adding this item would exceed max size
-                if current_size + item_size > max_size_bytes and len(current_chunk) > 0:
+                if current_size + item_size > max_size_bytes and current_chunk:
                     save_chunk()
 
-                current_chunk.append(item)
+                chunk_append(item)
+                blobs_append(item_blob)
                 current_size += item_size
 
             # Save final chunk
-            if len(current_chunk) > 0:
+            if current_chunk:
                 save_chunk()
 
         elif isinstance(self.json_data, dict):
+            chunk_set = current_chunk.__setitem__
+            blobs_append = current_blobs.append
             for key, value in self.json_data.items():
-                item_size = get_item_size({key: value})
-                item_size_mb = item_size / (1024 * 1024)
+                item_blob = encode_item({key: value})
+                item_size = len(item_blob)
 
                 # Check if single key-value pair exceeds max size
                 if item_size > max_size_bytes:
+                    # Only format the size for the dialog paths
+                    item_size_mb = item_size / (1024 * 1024)
                     # If value is a dict or list, offer choice to go deeper
                     if isinstance(value, dict) and len(value) > 0:
-                        # Create custom dialog with three options
-                        choice_dialog = tk.Toplevel(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.title("Oversized Key")
-                        choice_dialog.geometry("450x220")
-                        choice_dialog.transient(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.grab_set()
-
-                        # Center dialog
-                        choice_dialog.update_idletasks()
-                        x = (choice_dialog.winfo_screenwidth() // 2) - (225)
-                        y = (choice_dialog.winfo_screenheight() // 2) - (110)
-                        choice_dialog.geometry(f"450x220+{x}+{y}")
-
-                        choice = tk.StringVar(value="")
-
-                        ttk.Label(choice_dialog,
-                                 text=f"Key '{key}' is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
-                                 font=('Arial', 10, 'bold')).pack(pady=15)
-
-                        ttk.Label(choice_dialog, text="What would you like to do?").pack(pady=5)
-
-                        btn_frame = ttk.Frame(choice_dialog)
-                        btn_frame.pack(pady=20)
-
-                        ttk.Button(btn_frame, text="Create Separate File",
-                                  command=lambda: [choice.set("separate"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Split One Level Deeper",
-                                  command=lambda: [choice.set("deeper"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Skip This Key",
-                                  command=lambda: [choice.set("skip"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-
-                        choice_dialog.wait_window()
-
-                        if choice.get() == "separate":
-                            if len(current_chunk) > 0:
+                        choice = self._ask_oversized_choice(
+                            "Oversized Key",
+                            f"Key '{key}' is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
+                            "Skip This Key", parent_dialog)
+
+                        if choice == "separate":
+                            if current_chunk:
                                 save_chunk()
-                            oversized_chunk = {key: value}
-                            output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(oversized_chunk, f, indent=2, ensure_ascii=False)
+                            output_file = f"{part_prefix}{file_index + 1}.json"
+                            submit_write(output_file, item_blob)
                             file_index += 1
-                        elif choice.get() == "deeper":
-                            if len(current_chunk) > 0:
+                        elif choice == "deeper":
+                            if current_chunk:
                                 save_chunk()
                             split_nested_dict(key, value)
                         # else: skip
                         continue
                     elif isinstance(value, list) and len(value) > 0:
-                        # Create custom dialog with three options
-                        choice_dialog = tk.Toplevel(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.title("Oversized Key")
-                        choice_dialog.geometry("450x220")
-                        choice_dialog.transient(parent_dialog if parent_dialog else self.root)
-                        choice_dialog.grab_set()
-
-                        # Center dialog
-                        choice_dialog.update_idletasks()
-                        x = (choice_dialog.winfo_screenwidth() // 2) - (225)
-                        y = (choice_dialog.winfo_screenheight() // 2) - (110)
-                        choice_dialog.geometry(f"450x220+{x}+{y}")
-
-                        choice = tk.StringVar(value="")
-
-                        ttk.Label(choice_dialog,
-                                 text=f"Key '{key}' is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
-                                 font=('Arial', 10, 'bold')).pack(pady=15)
-
-                        ttk.Label(choice_dialog, text="What would you like to do?").pack(pady=5)
-
-                        btn_frame = ttk.Frame(choice_dialog)
-                        btn_frame.pack(pady=20)
-
-                        ttk.Button(btn_frame, text="Create Separate File",
-                                  command=lambda: [choice.set("separate"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Split One Level Deeper",
-                                  command=lambda: [choice.set("deeper"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-                        ttk.Button(btn_frame, text="Skip This Key",
-                                  command=lambda: [choice.set("skip"), choice_dialog.destroy()],
-                                  width=20).pack(pady=5)
-
-                        choice_dialog.wait_window()
-
-                        if choice.get() == "separate":
-                            if len(current_chunk) > 0:
+                        choice = self._ask_oversized_choice(
+                            "Oversized Key",
+                            f"Key '{key}' is {item_size_mb:.2f} MB\n(exceeds {size_value} {size_unit} limit)",
+                            "Skip This Key", parent_dialog)
+
+                        if choice == "separate":
+                            if current_chunk:
                                 save_chunk()
-                            oversized_chunk = {key: value}
-                            output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(oversized_chunk, f, indent=2, ensure_ascii=False)
+                            output_file = f"{part_prefix}{file_index + 1}.json"
+                            submit_write(output_file, item_blob)
                             file_index += 1
-                        elif choice.get() == "deeper":
-                            if len(current_chunk) > 0:
+                        elif choice == "deeper":
+                            if current_chunk:
                                 save_chunk()
                             split_nested_list(key, value)
                         # else: skip
@@ -2124,26 +2902,56 @@ class JSONEditorGUI:
                         )
 
                         if response:
-                            if len(current_chunk) > 0:
+                            if current_chunk:
                                 save_chunk()
-                            oversized_chunk = {key: value}
-                            output_file = os.path.join(output_folder, f"split_part_{file_index + 1}.json")
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(oversized_chunk, f, indent=2, ensure_ascii=False)
+                            output_file = f"{part_prefix}{file_index + 1}.json"
+                            submit_write(output_file, item_blob)
                             file_index += 1
                         continue
 
+                if pack_items:
+                    fitting.append((item_blob, item_size))
+                    continue
+
                 # Check if adding this key-value would exceed max size
-                if current_size + item_size > max_size_bytes and len(current_chunk) > 0:
+                if current_size + item_size > max_size_bytes and current_chunk:
                     save_chunk()
 
-                current_chunk[key] = value
+                chunk_set(key, value)
+                blobs_append(item_blob)
                 current_size += item_size
 
             # Save final chunk
-            if len(current_chunk) > 0:
+            if current_chunk:
                 save_chunk()
 
+        if pack_items and fitting:
+            # First-fit-decreasing: the biggest items claim bins first
+            # and smaller ones fill the leftover gaps, so far fewer
+            # parts than cutting in document order
+            bins = []
+            for blob, size in sorted(fitting, key=lambda entry: entry[1], reverse=True):
+                for open_bin in bins:
+                    if open_bin[1] + size <= max_size_bytes:
+                        open_bin[0].append(blob)
+                        open_bin[1] += size
+                        break
+                else:
+                    bins.append([[blob], size])
+            assemble = (_assemble_json_array if isinstance(self.json_data, list)
+                        else _assemble_json_object)
+            for bin_blobs, _ in bins:
+                output_file = f"{part_prefix}{file_index + 1}.json"
+                submit_write(output_file, assemble(bin_blobs))
+                file_index += 1
+
+        # Let the queued writes finish and surface the first failure
+        io_pool.shutdown(wait=True)
+        for future in write_futures:
+            future.result()
+
+        self._bulk_oversize_choice = None
+
         messagebox.showinfo("Split Complete",
                            f"Successfully split into {file_index} files in:\n{output_folder}")
         self.status_label.config(text=f"Split into {file_index} files")
@@ -2155,29 +2963,62 @@ class JSONEditorGUI:
             "Expanding all nodes may take time for large files. Continue?"
         )
         if response:
-            self._expand_all_recursive('')
-
-    def _expand_all_recursive(self, parent: str):
-        """Recursively expand all nodes."""
-        items = self.tree.get_children(parent)
-        for item in items:
-            self.tree.item(item, open=True)
-            self._expand_all_recursive(item)
+            self._cancel_expand_job()
+            self._set_open_chunk(self._iter_items(''), True)
+
+    def _cancel_expand_job(self):
+        """Drop any pending expand/collapse slice; its iids may be stale."""
+        if self._expand_job is not None:
+            self.root.after_cancel(self._expand_job)
+            self._expand_job = None
+
+    def _iter_items(self, parent: str):
+        """Yield every item id under parent, depth-first, without recursion."""
+        get_children = self.tree.get_children
+        stack = list(get_children(parent))
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(get_children(item))
+
+    def _set_open_chunk(self, items, open_flag: bool):
+        """Apply an open state in time slices, yielding to the event loop.
+
+        Toggling thousands of items in one go freezes the UI until Tk
+        gets to repaint; working in ~16ms slices through after_idle
+        keeps the app responsive regardless of how fast or slow the
+        per-item toggle happens to be on this machine.
+        """
+        # Call straight into Tcl: tree.item() builds and parses an option
+        # dict per call, which is pure overhead for a single -open flag.
+        tk_call = self.tree.tk.call
+        tree_path = self.tree._w
+        flag = '1' if open_flag else '0'
+        self._expand_job = None
+        monotonic = time.monotonic
+        deadline = monotonic() + 0.016
+        while True:
+            # Check the clock every so often, not per item
+            for _ in range(100):
+                item = next(items, None)
+                if item is None:
+                    return
+                tk_call(tree_path, 'item', item, '-open', flag)
+            if monotonic() >= deadline:
+                break
+        self._expand_job = self.root.after_idle(
+            self._set_open_chunk, items, open_flag)
 
     def collapse_all(self):
         """Collapse all tree nodes."""
-        self._collapse_all_recursive('')
-
-    def _collapse_all_recursive(self, parent: str):
-        """Recursively collapse all nodes."""
-        items = self.tree.get_children(parent)
-        for item in items:
-            self.tree.item(item, open=False)
-            self._collapse_all_recursive(item)
+        self._cancel_expand_job()
+        self._set_open_chunk(self._iter_items(''), False)
 
 
 def main():
-    root = tk.Tk()
+    # TkinterDnD.Tk is a drop-in Tk subclass that enables cross-platform
+    # file drag-and-drop when tkinterdnd2 is installed
+    root = tk.Tk() if TkinterDnD is None else TkinterDnD.Tk()
     app = JSONEditorGUI(root)
     root.mainloop()
 
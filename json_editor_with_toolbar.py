@@ -141,6 +141,16 @@ class JSONEditorGUI:
         self.root_node = None
         self.use_regex = False
 
+        # Python-side mirror of the tree (text and child order per iid):
+        # search and bulk expand walk these dicts instead of crossing
+        # the Python-Tcl boundary once per node
+        self._item_text = {}
+        self._item_children = {}
+        self._search_job = None
+        self._last_found = None
+        self._setall_proc_installed = False
+        self._pattern_cache = {}
+
         # Detect platform for keyboard shortcuts
         import platform
         self.is_mac = platform.system() == 'Darwin'
@@ -237,6 +247,8 @@ class JSONEditorGUI:
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         self.search_entry.bind('<Return>', lambda e: self.find_next())
+        # Editing the needle restarts the search from the top
+        self.search_entry.bind('<KeyRelease>', lambda e: setattr(self, '_last_found', None))
 
         # Regex checkbox
         self.regex_var = tk.BooleanVar()
@@ -456,24 +468,45 @@ class JSONEditorGUI:
         thread = threading.Thread(target=load_thread, daemon=True)
         thread.start()
 
+    def _tree_insert(self, parent_id: str, **kwargs) -> str:
+        """tree.insert that also maintains the Python-side mirror."""
+        iid = self.tree.insert(parent_id, 'end', **kwargs)
+        self._item_text[iid] = kwargs.get('text', '')
+        self._item_children.setdefault(parent_id, []).append(iid)
+        return iid
+
+    def _tree_delete(self, iid: str, parent_id: str):
+        """tree.delete that also maintains the Python-side mirror."""
+        self.tree.delete(iid)
+        self._item_text.pop(iid, None)
+        self._item_children.pop(iid, None)
+        siblings = self._item_children.get(parent_id)
+        if siblings is not None:
+            try:
+                siblings.remove(iid)
+            except ValueError:
+                pass
+
     def _populate_tree(self):
         """Populate the tree view with JSON data."""
         # Clear existing tree
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self._item_text.clear()
+        self._item_children.clear()
 
         if self.json_data is None:
             return
 
         # Create root node
         if isinstance(self.json_data, dict):
-            root_id = self.tree.insert('', 'end', text='Root {}', open=True)
+            root_id = self._tree_insert('', text='Root {}', open=True)
             self._add_dict_nodes(root_id, self.json_data)
         elif isinstance(self.json_data, list):
-            root_id = self.tree.insert('', 'end', text='Root []', open=True)
+            root_id = self._tree_insert('', text='Root []', open=True)
             self._add_list_nodes(root_id, self.json_data)
         else:
-            self.tree.insert('', 'end', text=f'Root: {self.json_data}')
+            self._tree_insert('', text=f'Root: {self.json_data}')
 
     def _add_dict_nodes(self, parent_id: str, data: dict, max_items: int = 1000):
         """Add dictionary nodes to tree (with lazy loading for large dicts)."""
@@ -484,7 +517,7 @@ class JSONEditorGUI:
             for key, value in items[:max_items]:
                 self._add_node(parent_id, key, value)
             # Add placeholder for more items
-            self.tree.insert(parent_id, 'end', text=f'... ({len(items) - max_items} more items)', tags=('placeholder',))
+            self._tree_insert(parent_id, text=f'... ({len(items) - max_items} more items)', tags=('placeholder',))
         else:
             for key, value in items:
                 self._add_node(parent_id, key, value)
@@ -496,7 +529,7 @@ class JSONEditorGUI:
             for i, value in enumerate(data[:max_items]):
                 self._add_node(parent_id, f"[{i}]", value)
             # Add placeholder for more items
-            self.tree.insert(parent_id, 'end', text=f'... ({len(data) - max_items} more items)', tags=('placeholder',))
+            self._tree_insert(parent_id, text=f'... ({len(data) - max_items} more items)', tags=('placeholder',))
         else:
             for i, value in enumerate(data):
                 self._add_node(parent_id, f"[{i}]", value)
@@ -505,26 +538,29 @@ class JSONEditorGUI:
         """Add a single node to the tree."""
         if isinstance(value, dict):
             count = len(value)
-            node_id = self.tree.insert(parent_id, 'end', text=f'{key} {{{count}}}', tags=('object',))
+            node_id = self._tree_insert(parent_id, text=f'{key} {{{count}}}', tags=('object',))
             if count > 0:
                 # Add placeholder for lazy loading
-                self.tree.insert(node_id, 'end', text='Loading...', tags=('lazy',))
+                self._tree_insert(node_id, text='Loading...', tags=('lazy',))
         elif isinstance(value, list):
             count = len(value)
-            node_id = self.tree.insert(parent_id, 'end', text=f'{key} [{count}]', tags=('array',))
+            node_id = self._tree_insert(parent_id, text=f'{key} [{count}]', tags=('array',))
             if count > 0:
                 # Add placeholder for lazy loading
-                self.tree.insert(node_id, 'end', text='Loading...', tags=('lazy',))
+                self._tree_insert(node_id, text='Loading...', tags=('lazy',))
         else:
             # Leaf node
             value_str = str(value)
             if len(value_str) > 100:
                 value_str = value_str[:100] + "..."
-            self.tree.insert(parent_id, 'end', text=f'{key}: {value_str}', tags=('value',))
+            self._tree_insert(parent_id, text=f'{key}: {value_str}', tags=('value',))
 
     def on_tree_expand(self, event):
         """Handle lazy loading when a node is expanded."""
-        item_id = self.tree.focus()
+        self._ensure_children_loaded(self.tree.focus())
+
+    def _ensure_children_loaded(self, item_id: str):
+        """Replace a lazy placeholder under item_id with real children."""
         children = self.tree.get_children(item_id)
 
         # Check if this node needs lazy loading
@@ -532,7 +568,7 @@ class JSONEditorGUI:
             child = children[0]
             if 'lazy' in self.tree.item(child, 'tags'):
                 # Remove placeholder
-                self.tree.delete(child)
+                self._tree_delete(child, item_id)
 
                 # Get the actual data for this node
                 value = self._get_value_for_item(item_id)
@@ -700,17 +736,21 @@ class JSONEditorGUI:
 
         if isinstance(value, dict):
             key = text.split(' {')[0] if ' {' in text else text
-            self.tree.item(item_id, text=f'{key} {{{len(value)}}}')
+            new_text = f'{key} {{{len(value)}}}'
         elif isinstance(value, list):
             key = text.split(' [')[0] if ' [' in text else text
-            self.tree.item(item_id, text=f'{key} [{len(value)}]')
+            new_text = f'{key} [{len(value)}]'
+        elif ': ' in text:
+            key = text.split(': ')[0]
+            value_str = str(value)
+            if len(value_str) > 100:
+                value_str = value_str[:100] + "..."
+            new_text = f'{key}: {value_str}'
         else:
-            if ': ' in text:
-                key = text.split(': ')[0]
-                value_str = str(value)
-                if len(value_str) > 100:
-                    value_str = value_str[:100] + "..."
-                self.tree.item(item_id, text=f'{key}: {value_str}')
+            return
+
+        self.tree.item(item_id, text=new_text)
+        self._item_text[item_id] = new_text
 
     def revert_changes(self):
         """Revert changes in the value editor."""
@@ -788,8 +828,16 @@ class JSONEditorGUI:
         self.modified = False
 
         # Clear UI
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+            self._search_job = None
+        self._last_found = None
+        self._setall_proc_installed = False
+        self._pattern_cache = {}
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self._item_text.clear()
+        self._item_children.clear()
         self.value_text.delete('1.0', tk.END)
         self.path_label.config(text='')
         self.status_label.config(text='No file loaded')
@@ -803,106 +851,173 @@ class JSONEditorGUI:
 
     def find_next(self):
         """Find next occurrence of search term."""
+        # Pressing Enter again aborts any search still in flight
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+            self._search_job = None
+
         search_term = self.search_var.get()
-        if not search_term:
+        if not search_term or self.json_data is None:
             return
 
         use_regex = self.regex_var.get()
 
-        # Validate regex if regex mode is enabled
+        # Compile once (validating in the same pass) and hand the matcher
+        # down, so the per-node check never re-derives the pattern; with
+        # regex off the needle is lowercased here instead of per node
         if use_regex:
-            try:
-                re.compile(search_term)
-            except re.error as e:
-                messagebox.showerror("Invalid Regex", f"Invalid regular expression:\n{str(e)}")
-                return
-
-        # Get current selection or start from beginning
-        current = self.tree.selection()
-        start_item = current[0] if current else ''
-
-        # Search through tree items
-        found = self._search_tree(start_item, search_term, use_regex)
-
-        if found:
-            self.tree.selection_set(found)
-            self.tree.focus(found)
-            self.tree.see(found)
+            matcher = self._pattern_cache.get(search_term)
+            if matcher is None:
+                try:
+                    matcher = re.compile(search_term, re.IGNORECASE)
+                except re.error as e:
+                    messagebox.showerror("Invalid Regex", f"Invalid regular expression:\n{str(e)}")
+                    return
+                if len(self._pattern_cache) >= 32:
+                    # Drop the oldest entry; insertion order is age order
+                    self._pattern_cache.pop(next(iter(self._pattern_cache)))
+                self._pattern_cache[search_term] = matcher
         else:
-            search_type = "regex pattern" if use_regex else "text"
-            messagebox.showinfo("Not Found", f"'{search_term}' not found ({search_type})")
-
-    def _search_tree(self, start_item: str, search_term: str, use_regex: bool = False, started: bool = False) -> Optional[str]:
-        """Recursively search tree for term."""
-        items = self.tree.get_children() if not start_item else self.tree.get_children('')
-
-        for item in items:
-            if started or item == start_item:
+            matcher = search_term.lower()
+
+        # Resume from the last hit (a path tuple) without touching Tk
+        start_path = self._last_found
+
+        stack = [((), 'Root', self.json_data)]
+        self._search_step(stack, start_path is None, start_path, matcher,
+                          search_term, use_regex)
+
+    def _search_step(self, stack, started, start_path, matcher, search_term,
+                     use_regex):
+        """Run one slice of the search walk over the JSON data itself.
+
+        Walking self.json_data instead of the Tk tree means matches in
+        subtrees that were never expanded are still found, and nothing
+        but the matched path ever pays the tree-insert cost. Visits up
+        to 5000 values per slice, then yields to the event loop with
+        after_idle; the pending job handle in _search_job lets a new
+        find (or closing the file) cancel it.
+        """
+        self._search_job = None
+        matches = self._matches_search
+        lower = isinstance(matcher, str)
+
+        for _ in range(5000):
+            if not stack:
+                search_type = "regex pattern" if use_regex else "text"
+                messagebox.showinfo("Not Found", f"'{search_term}' not found ({search_type})")
+                return
+            path, key, value = stack.pop()
+            if isinstance(value, dict):
+                text = f'{key} {{{len(value)}}}'
+                children = [(path + (k,), k, v) for k, v in value.items()]
+            elif isinstance(value, list):
+                text = f'{key} [{len(value)}]'
+                children = [(path + (f'[{i}]',), f'[{i}]', v)
+                            for i, v in enumerate(value)]
+            else:
+                text = f'{key}: {value}'
+                children = None
+            if started:
+                if matches(text.lower() if lower else text, matcher):
+                    self._last_found = path
+                    # One idle slot for all the reveal Tcl calls, so Tk
+                    # coalesces the redraw under held-down repeat-find
+                    self.root.after_idle(self._reveal_path, path)
+                    return
+            elif path == start_path:
+                # Matching begins with the next value in the walk
                 started = True
-                if item != start_item:
-                    text = self.tree.item(item, 'text')
-                    if self._matches_search(text, search_term, use_regex):
-                        return item
-
-            # Search children
-            children = self.tree.get_children(item)
             if children:
-                result = self._search_tree_children(item, search_term, use_regex)
-                if result:
-                    return result
-
-        return None
-
-    def _search_tree_children(self, parent: str, search_term: str, use_regex: bool = False) -> Optional[str]:
-        """Search children of a tree item."""
-        for item in self.tree.get_children(parent):
-            text = self.tree.item(item, 'text')
-            if self._matches_search(text, search_term, use_regex):
-                return item
-
-            # Recursively search children
-            result = self._search_tree_children(item, search_term, use_regex)
-            if result:
-                return result
-
-        return None
-
-    def _matches_search(self, text: str, search_term: str, use_regex: bool) -> bool:
-        """Check if text matches the search term (with or without regex)."""
-        if use_regex:
-            try:
-                return re.search(search_term, text, re.IGNORECASE) is not None
-            except re.error:
-                return False
-        else:
-            return search_term.lower() in text.lower()
+                children.reverse()
+                stack.extend(children)
+
+        self._search_job = self.root.after_idle(
+            self._search_step, stack, started, start_path, matcher,
+            search_term, use_regex)
+
+    def _reveal_path(self, path):
+        """Select the tree item for path, creating items only along it."""
+        iid = self._materialize_path(path)
+        if iid is None:
+            messagebox.showinfo(
+                "Found",
+                f"Match at {' > '.join(path) or 'Root'} is beyond the items shown in the tree")
+            return
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        self.tree.see(iid)
+
+    def _materialize_path(self, path):
+        """Walk path from the root item, lazily loading each level.
+
+        Returns the iid of the item for path, or None if a component is
+        not present in the tree (e.g. past a '... more items' cutoff).
+        """
+        roots = self._item_children.get('')
+        if not roots:
+            return None
+        iid = roots[0]
+        item_text = self._item_text
+        for key in path:
+            self._ensure_children_loaded(iid)
+            self.tree.item(iid, open=True)
+            target = None
+            for child in self._item_children.get(iid, ()):
+                text = item_text.get(child, '')
+                if (text == key or text.startswith(key + ': ')
+                        or text.startswith(key + ' {')
+                        or text.startswith(key + ' [')):
+                    target = child
+                    break
+            if target is None:
+                return None
+            iid = target
+        return iid
+
+    def _matches_search(self, text: str, matcher) -> bool:
+        """Check if text matches: a lowercased needle against lowered
+        text, or a compiled pattern against the display text."""
+        if isinstance(matcher, str):
+            return matcher in text
+        return matcher.search(text) is not None
 
     def expand_all(self):
         """Expand all tree nodes (with confirmation for large trees)."""
+        # Small trees expand instantly; don't bother the user with a dialog
+        node_count = sum(len(children) for children in self._item_children.values())
+        if node_count < 5000:
+            self._set_open_all(True)
+            return
         response = messagebox.askyesno(
             "Expand All",
             "Expanding all nodes may take time for large files. Continue?"
         )
         if response:
-            self._expand_all_recursive('')
-
-    def _expand_all_recursive(self, parent: str):
-        """Recursively expand all nodes."""
-        items = self.tree.get_children(parent)
-        for item in items:
-            self.tree.item(item, open=True)
-            self._expand_all_recursive(item)
+            # Let the dialog close before the expansion starts
+            self.root.after_idle(self._set_open_all, True)
 
     def collapse_all(self):
         """Collapse all tree nodes."""
-        self._collapse_all_recursive('')
-
-    def _collapse_all_recursive(self, parent: str):
-        """Recursively collapse all nodes."""
-        items = self.tree.get_children(parent)
-        for item in items:
-            self.tree.item(item, open=False)
-            self._collapse_all_recursive(item)
+        self._set_open_all(False)
+
+    def _set_open_all(self, open_flag: bool):
+        """Set the open state of every node with one Tcl call.
+
+        A recursive Tcl proc (installed once) walks the tree inside the
+        interpreter, so the whole operation costs a single Python-Tcl
+        round-trip instead of one per node.
+        """
+        tk_interp = self.tree.tk
+        if not self._setall_proc_installed:
+            tk_interp.eval(
+                'proc _tv_set_open_all {w item state} {'
+                ' if {$item ne ""} {$w item $item -open $state};'
+                ' foreach c [$w children $item] {_tv_set_open_all $w $c $state}'
+                ' }'
+            )
+            self._setall_proc_installed = True
+        tk_interp.eval(f'_tv_set_open_all {self.tree} {{}} {1 if open_flag else 0}')
 
 
 def main():